@@ -6,6 +6,8 @@ Maps the continuous bet sizing space to a finite number of abstract actions.
 
 from typing import Optional
 
+import numpy as np
+
 from ..game.action import Action, ActionType
 from ..game.game_state import GameState, Street
 
@@ -23,6 +25,12 @@ class ActionAbstraction:
 	to keep the game tree tractable.
 	"""
 
+	__slots__ = (
+		'_preflop_sizes', '_postflop_sizes', '_include_all_in',
+		'_preflop_size_arr', '_postflop_size_arr',
+		'_action_cache', '_action_index_cache'
+	)
+
 	def __init__(
 		self,
 		preflop_raise_sizes: Optional[list[float]] = None,
@@ -37,27 +45,47 @@ class ActionAbstraction:
 			postflop_bet_sizes: Bet sizes as pot fractions
 			include_all_in: Whether to always include all-in option
 		"""
-		self._preflop_sizes = (
+		self._preflop_sizes = tuple(
 			preflop_raise_sizes if preflop_raise_sizes is not None
 			else PREFLOP_RAISE_SIZES
 		)
-		self._postflop_sizes = (
+		self._postflop_sizes = tuple(
 			postflop_bet_sizes if postflop_bet_sizes is not None
 			else POSTFLOP_BET_SIZES
 		)
 		self._include_all_in = include_all_in
 
-	def get_abstract_actions(self, game_state: GameState) -> list[Action]:
+		# Size vectors for computing all bet sizes in one shot
+		self._preflop_size_arr = np.asarray(self._preflop_sizes, dtype=np.float64)
+		self._postflop_size_arr = np.asarray(self._postflop_sizes, dtype=np.float64)
+
+		# Cache keyed by GameState.action_signature()
+		self._action_cache: dict[int, tuple[Action, ...]] = {}
+
+		# Per action-tuple lookup of Action -> index (Action hashes by
+		# its (type, amount) pair, so equal actions share a slot)
+		self._action_index_cache: dict[
+			tuple[Action, ...], dict[Action, int]
+		] = {}
+
+	def get_abstract_actions(self, game_state: GameState) -> tuple[Action, ...]:
 		"""
 		Get abstracted legal actions for current game state.
 
 		Returns a subset of legal actions with standardized bet sizes.
+		Results are cached by the packed-int state signature, so
+		repeated tree visits reuse one tuple.
 		"""
 		if game_state.is_terminal:
-			return []
+			return ()
 
-		actions = []
 		player = game_state.current_player
+		signature = game_state.action_signature()
+		cached = self._action_cache.get(signature)
+		if cached is not None:
+			return cached
+
+		actions = []
 		my_stack = game_state.stacks[player]
 		my_bet = game_state.bets_this_round[player]
 		opp_bet = game_state.bets_this_round[1 - player]
@@ -79,54 +107,45 @@ class ActionAbstraction:
 			else:
 				actions.append(Action.call())
 
-		# Add abstracted bet/raise sizes
+		# Add abstracted bet/raise sizes, skipping sizes that collide
+		# after rounding so the result is duplicate-free by construction
 		if my_stack > to_call:
+			seen_sizes: set[int] = set()
+
 			if game_state.street == Street.PREFLOP:
 				# Preflop: use BB multipliers
-				for mult in self._preflop_sizes:
-					bet_size = int(mult * game_state.big_blind)
-					if to_call == 0:
-						# Open raise
-						if bet_size <= my_stack:
-							actions.append(Action.bet(bet_size))
-					else:
-						# 3-bet or higher
-						raise_to = opp_bet + bet_size
-						if raise_to - my_bet <= my_stack:
-							actions.append(Action.raise_to(raise_to))
+				sizes = (
+					self._preflop_size_arr * game_state.big_blind
+				).astype(np.int64)
 			else:
-				# Postflop: use pot fractions
-				for frac in self._postflop_sizes:
-					bet_size = int(frac * pot)
-					bet_size = max(bet_size, game_state.big_blind)
-
-					if to_call == 0:
-						# Bet
-						if bet_size <= my_stack:
-							actions.append(Action.bet(bet_size))
-					else:
-						# Raise
-						raise_to = opp_bet + bet_size
-						if raise_to - my_bet <= my_stack:
-							actions.append(Action.raise_to(raise_to))
-
-			# Always include all-in if configured
-			if self._include_all_in and my_stack > to_call:
-				all_in = Action.all_in(my_stack)
-				if all_in not in actions:
-					actions.append(all_in)
-
-		return self._deduplicate_actions(actions)
-
-	def _deduplicate_actions(self, actions: list[Action]) -> list[Action]:
-		"""Remove duplicate actions."""
-		seen = set()
-		result = []
-		for action in actions:
-			key = (action.type, action.amount)
-			if key not in seen:
-				seen.add(key)
-				result.append(action)
+				# Postflop: use pot fractions, floored at one big blind
+				sizes = np.maximum(
+					(self._postflop_size_arr * pot).astype(np.int64),
+					game_state.big_blind
+				)
+
+			for bet_size in sizes.tolist():
+				if bet_size in seen_sizes:
+					continue
+				seen_sizes.add(bet_size)
+
+				if to_call == 0:
+					# Bet / open raise
+					if bet_size <= my_stack:
+						actions.append(Action.bet(bet_size))
+				else:
+					# Raise / 3-bet or higher
+					raise_to = opp_bet + bet_size
+					if raise_to - my_bet <= my_stack:
+						actions.append(Action.raise_to(raise_to))
+
+			# Always include all-in if configured (no other branch can
+			# have emitted an all-in when my_stack > to_call)
+			if self._include_all_in:
+				actions.append(Action.all_in(my_stack))
+
+		result = tuple(actions)
+		self._action_cache[signature] = result
 		return result
 
 	def map_to_abstract(
@@ -169,24 +188,34 @@ class ActionAbstraction:
 		Returns index in range [0, num_actions).
 		"""
 		abstract_actions = self.get_abstract_actions(game_state)
-		try:
-			return abstract_actions.index(action)
-		except ValueError:
-			# Map to closest abstract action
-			mapped = self.map_to_abstract(action, game_state)
-			return abstract_actions.index(mapped)
+
+		index = self._action_index_cache.get(abstract_actions)
+		if index is None:
+			index = {a: i for i, a in enumerate(abstract_actions)}
+			self._action_index_cache[abstract_actions] = index
+
+		encoded = index.get(action)
+		if encoded is not None:
+			return encoded
+
+		# Map to closest abstract action
+		mapped = self.map_to_abstract(action, game_state)
+		encoded = index.get(mapped)
+		if encoded is None:
+			raise ValueError(f'{mapped} is not an abstract action')
+		return encoded
 
 	def get_num_actions(self, game_state: GameState) -> int:
-		"""Get number of abstract actions available."""
+		"""Get number of abstract actions (len of the cached tuple)."""
 		return len(self.get_abstract_actions(game_state))
 
 	@property
-	def preflop_raise_sizes(self) -> list[float]:
-		"""Preflop raise sizes as BB multipliers."""
-		return self._preflop_sizes.copy()
+	def preflop_raise_sizes(self) -> tuple[float, ...]:
+		"""Preflop raise sizes as BB multipliers (read-only)."""
+		return self._preflop_sizes
 
 	@property
-	def postflop_bet_sizes(self) -> list[float]:
-		"""Postflop bet sizes as pot fractions."""
-		return self._postflop_sizes.copy()
+	def postflop_bet_sizes(self) -> tuple[float, ...]:
+		"""Postflop bet sizes as pot fractions (read-only)."""
+		return self._postflop_sizes
 
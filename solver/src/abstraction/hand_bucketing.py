@@ -5,12 +5,190 @@ Groups similar hands into buckets to reduce the game tree size
 while preserving strategic depth.
 """
 
+from functools import lru_cache
 from typing import Optional
 import numpy as np
 
-from ..enums import Rank, Suit
+from ..enums import Rank
 from ..game.card import Card
-from ..game.hand_evaluator import HandEvaluator
+from ..game.hand_evaluator import (
+	HandEvaluator, card_index, _TOP5_TABLE, _STRAIGHT_TABLE
+)
+
+# Numba is optional (see requirements.txt); the NumPy path is the fallback
+try:
+	from numba import njit
+	_HAS_NUMBA = True
+except ImportError:
+	_HAS_NUMBA = False
+
+
+# Cards are encoded for the vectorized equity path with the evaluate_batch
+# contract, card_index (imported above)
+ALL_CARDS = np.arange(52, dtype=np.int64)
+
+
+if _HAS_NUMBA:
+	@njit(cache=True)
+	def _score_seven(cards, top5, straight):
+		"""
+		Score one 7-card hand (same order as HandEvaluator.evaluate_batch).
+		"""
+		rank_bits = 0
+		rank_counts = np.zeros(13, dtype=np.int64)
+		suit_counts = np.zeros(4, dtype=np.int64)
+		for i in range(7):
+			r = cards[i] >> 2
+			rank_bits |= 1 << r
+			rank_counts[r] += 1
+			suit_counts[cards[i] & 3] += 1
+
+		flush_bits = 0
+		for s in range(4):
+			if suit_counts[s] >= 5:
+				for i in range(7):
+					if cards[i] & 3 == s:
+						flush_bits |= 1 << (cards[i] >> 2)
+				break
+
+		if flush_bits and straight[flush_bits] > 0:
+			return (8 << 20) | straight[flush_bits]
+
+		quad_rank = 0
+		trip_rank = 0
+		paired_bits = 0
+		exact_pair_bits = 0
+		num_pairs = 0
+		for r in range(13):
+			count = rank_counts[r]
+			if count == 4:
+				quad_rank = r + 2
+			if count >= 3:
+				trip_rank = r + 2
+			if count >= 2:
+				paired_bits |= 1 << r
+			if count == 2:
+				exact_pair_bits |= 1 << r
+				num_pairs += 1
+
+		if quad_rank > 0:
+			kicker = top5[rank_bits & ~(1 << (quad_rank - 2))] >> 16
+			return (7 << 20) | (quad_rank << 4) | kicker
+
+		if trip_rank > 0:
+			trip_bit = 1 << (trip_rank - 2)
+			if paired_bits & ~trip_bit:
+				fh_pair = top5[paired_bits & ~trip_bit] >> 16
+				return (6 << 20) | (trip_rank << 4) | fh_pair
+
+		if flush_bits:
+			return (5 << 20) | top5[flush_bits]
+
+		if straight[rank_bits] > 0:
+			return (4 << 20) | straight[rank_bits]
+
+		if trip_rank > 0:
+			kickers = top5[rank_bits & ~(1 << (trip_rank - 2))] >> 12
+			return (3 << 20) | (trip_rank << 8) | kickers
+
+		if num_pairs >= 2:
+			two_pair_top = top5[exact_pair_bits] >> 12
+			high_pair = two_pair_top >> 4
+			low_pair = two_pair_top & 0xF
+			used = (1 << (high_pair - 2)) | (1 << (low_pair - 2))
+			kicker = top5[rank_bits & ~used] >> 16
+			return (2 << 20) | (two_pair_top << 4) | kicker
+
+		if num_pairs == 1:
+			pair_rank = top5[exact_pair_bits] >> 16
+			kickers = top5[rank_bits & ~(1 << (pair_rank - 2))] >> 8
+			return (1 << 20) | (pair_rank << 12) | kickers
+
+		return top5[rank_bits]
+
+	@njit(cache=True)
+	def _equity_kernel(hole, board, samples, top5, straight):
+		"""
+		Run all equity simulations in one compiled loop.
+
+		samples rows are [opp1, opp2, runout...]; returns win share.
+		"""
+		n = samples.shape[0]
+		board_len = board.shape[0]
+		runout_len = 5 - board_len
+		my_cards = np.empty(7, dtype=np.int64)
+		opp_cards = np.empty(7, dtype=np.int64)
+
+		score = 0.0
+		for i in range(n):
+			my_cards[0] = hole[0]
+			my_cards[1] = hole[1]
+			opp_cards[0] = samples[i, 0]
+			opp_cards[1] = samples[i, 1]
+			for j in range(board_len):
+				my_cards[2 + j] = board[j]
+				opp_cards[2 + j] = board[j]
+			for j in range(runout_len):
+				card = samples[i, 2 + j]
+				my_cards[2 + board_len + j] = card
+				opp_cards[2 + board_len + j] = card
+
+			my_rank = _score_seven(my_cards, top5, straight)
+			opp_rank = _score_seven(opp_cards, top5, straight)
+			if my_rank > opp_rank:
+				score += 1.0
+			elif my_rank == opp_rank:
+				score += 0.5
+
+		return score / n
+
+
+# Standard preflop hand rankings (approximate), strongest first; shared
+# by every HandBucketing instance
+_HAND_RANKINGS = (
+	'AA', 'KK', 'QQ', 'AKs', 'JJ', 'AQs', 'KQs', 'AJs', 'KJs', 'TT',
+	'AKo', 'ATs', 'QJs', 'KTs', 'QTs', 'JTs', '99', 'AQo', 'A9s',
+	'KQo', '88', 'K9s', 'T9s', 'A8s', 'Q9s', 'J9s', 'AJo', 'A5s',
+	'77', 'A7s', 'KJo', 'A4s', 'A3s', 'A6s', 'QJo', '66', 'K8s',
+	'T8s', 'A2s', '98s', 'J8s', 'ATo', 'Q8s', 'K7s', 'KTo', '55',
+	'JTo', '87s', 'QTo', '44', '33', '22', 'K6s', '97s', 'K5s',
+	'76s', 'T7s', 'K4s', 'K3s', 'K2s', 'Q7s', '86s', '65s', 'J7s',
+	'54s', 'Q6s', '75s', '96s', 'Q5s', '64s', 'Q4s', 'Q3s', 'T9o',
+	'T6s', 'Q2s', 'A9o', '53s', '85s', 'J6s', 'J9o', 'K9o', 'J5s',
+	'Q9o', '43s', '74s', 'J4s', 'J3s', '95s', 'J2s', '63s', 'A8o',
+	'52s', 'T5s', '84s', 'T4s', 'T3s', '42s', 'T2s', '98o', 'T8o',
+	'A5o', 'A7o', '73s', 'A4o', '32s', '94s', '93s', 'J8o', 'A3o',
+	'62s', '92s', 'K8o', 'A6o', '87o', 'Q8o', '83s', 'A2o', '82s',
+	'97o', '72s', '76o', 'K7o', '65o', 'T7o', 'K6o', '86o', '54o',
+	'K5o', 'J7o', '75o', 'Q7o', 'K4o', 'K3o', '96o', 'K2o', '64o',
+	'Q6o', '53o', '85o', 'T6o', 'Q5o', '43o', 'Q4o', 'Q3o', '74o',
+	'Q2o', 'J6o', '63o', 'J5o', '95o', '52o', 'J4o', 'J3o', '42o',
+	'J2o', '84o', 'T5o', 'T4o', '32o', 'T3o', '73o', 'T2o', '62o',
+	'94o', '93o', '92o', '83o', '82o', '72o'
+)
+
+
+@lru_cache(maxsize=None)
+def _build_preflop_table(
+	preflop_buckets: int
+) -> dict[tuple[int, int, bool], int]:
+	"""
+	Build lookup table for 169 canonical preflop hands.
+
+	Keyed by (high_rank_value, low_rank_value, suited) so the hot
+	lookup path needs no canonical hand string construction. Cached
+	per bucket count and shared across HandBucketing instances.
+	"""
+	table = {}
+	for idx, hand in enumerate(_HAND_RANKINGS):
+		# Map to bucket based on configured bucket count
+		bucket = (idx * preflop_buckets) // 169
+		hi = Rank.from_symbol(hand[0]).value
+		lo = Rank.from_symbol(hand[1]).value
+		suited = hand.endswith('s')
+		table[(hi, lo, suited)] = bucket
+
+	return table
 
 
 class HandBucketing:
@@ -38,7 +216,14 @@ class HandBucketing:
 		self._preflop_buckets = min(preflop_buckets, 169)
 		self._postflop_buckets = postflop_buckets
 		self._equity_samples = equity_samples
-		self._preflop_table = self._build_preflop_table()
+		self._preflop_table = _build_preflop_table(self._preflop_buckets)
+
+		# Hand + board determines the bucket, so memoize the Monte Carlo
+		# equity run per canonical deal. Bound per instance to avoid
+		# class-level lru_cache pinning self.
+		self._equity_bucket_cached = lru_cache(maxsize=1 << 20)(
+			self._equity_bucket
+		)
 
 	def get_bucket(
 		self,
@@ -55,81 +240,40 @@ class HandBucketing:
 		Returns:
 			Bucket ID (0 to num_buckets-1)
 		"""
-		if not board:
+		if board is None or len(board) == 0:
 			return self._preflop_bucket(hole_cards)
-		return self._equity_bucket(hole_cards, board)
 
-	def _build_preflop_table(self) -> dict[str, int]:
-		"""
-		Build lookup table for 169 canonical preflop hands.
-
-		Hands are ordered by approximate hand strength:
-		AA, KK, QQ, AKs, JJ, AQs, KQs, AJs, KJs, TT, AKo, ...
-		"""
-		# Standard preflop hand rankings (approximate)
-		hand_rankings = [
-			'AA', 'KK', 'QQ', 'AKs', 'JJ', 'AQs', 'KQs', 'AJs', 'KJs', 'TT',
-			'AKo', 'ATs', 'QJs', 'KTs', 'QTs', 'JTs', '99', 'AQo', 'A9s',
-			'KQo', '88', 'K9s', 'T9s', 'A8s', 'Q9s', 'J9s', 'AJo', 'A5s',
-			'77', 'A7s', 'KJo', 'A4s', 'A3s', 'A6s', 'QJo', '66', 'K8s',
-			'T8s', 'A2s', '98s', 'J8s', 'ATo', 'Q8s', 'K7s', 'KTo', '55',
-			'JTo', '87s', 'QTo', '44', '33', '22', 'K6s', '97s', 'K5s',
-			'76s', 'T7s', 'K4s', 'K3s', 'K2s', 'Q7s', '86s', '65s', 'J7s',
-			'54s', 'Q6s', '75s', '96s', 'Q5s', '64s', 'Q4s', 'Q3s', 'T9o',
-			'T6s', 'Q2s', 'A9o', '53s', '85s', 'J6s', 'J9o', 'K9o', 'J5s',
-			'Q9o', '43s', '74s', 'J4s', 'J3s', '95s', 'J2s', '63s', 'A8o',
-			'52s', 'T5s', '84s', 'T4s', 'T3s', '42s', 'T2s', '98o', 'T8o',
-			'A5o', 'A7o', '73s', 'A4o', '32s', '94s', '93s', 'J8o', 'A3o',
-			'62s', '92s', 'K8o', 'A6o', '87o', 'Q8o', '83s', 'A2o', '82s',
-			'97o', '72s', '76o', 'K7o', '65o', 'T7o', 'K6o', '86o', '54o',
-			'K5o', 'J7o', '75o', 'Q7o', 'K4o', 'K3o', '96o', 'K2o', '64o',
-			'Q6o', '53o', '85o', 'T6o', 'Q5o', '43o', 'Q4o', 'Q3o', '74o',
-			'Q2o', 'J6o', '63o', 'J5o', '95o', '52o', 'J4o', 'J3o', '42o',
-			'J2o', '84o', 'T5o', 'T4o', '32o', 'T3o', '73o', 'T2o', '62o',
-			'94o', '93o', '92o', '83o', '82o', '72o'
-		]
-
-		table = {}
-		for idx, hand in enumerate(hand_rankings):
-			# Map to bucket based on configured bucket count
-			bucket = (idx * self._preflop_buckets) // 169
-			table[hand] = bucket
-
-		return table
+		# Canonicalize card order so permuted deals share a cache entry
+		return self._equity_bucket_cached(
+			tuple(sorted(hole_cards, key=card_index)),
+			tuple(sorted(board, key=card_index))
+		)
 
 	def _preflop_bucket(self, cards: list[Card]) -> int:
 		"""
 		Get preflop bucket for two hole cards.
 
-		Converts to canonical form (higher rank first, suited/offsuit suffix).
+		Canonical form is (higher rank value, lower rank value, suited);
+		pairs are never suited so the tuple stays unambiguous.
 		"""
 		if len(cards) != 2:
 			raise ValueError(f'Expected 2 hole cards, got {len(cards)}')
 
 		c1, c2 = cards
-		r1, r2 = c1.rank, c2.rank
+		v1, v2 = c1.rank.value, c2.rank.value
 
 		# Order by rank (higher first)
-		if r1.value < r2.value:
-			r1, r2 = r2, r1
-			c1, c2 = c2, c1
+		if v1 < v2:
+			v1, v2 = v2, v1
 
-		# Build canonical hand string
 		is_suited = c1.suit == c2.suit
-		is_pair = r1 == r2
-
-		if is_pair:
-			hand_str = f'{r1.symbol}{r2.symbol}'
-		else:
-			suffix = 's' if is_suited else 'o'
-			hand_str = f'{r1.symbol}{r2.symbol}{suffix}'
 
-		return self._preflop_table.get(hand_str, 0)
+		return self._preflop_table.get((v1, v2, is_suited), 0)
 
 	def _equity_bucket(
 		self,
-		hole_cards: list[Card],
-		board: list[Card]
+		hole_cards: tuple[Card, ...],
+		board: tuple[Card, ...]
 	) -> int:
 		"""
 		Get postflop bucket based on Monte Carlo equity estimation.
@@ -145,53 +289,61 @@ class HandBucketing:
 
 	def _calculate_equity(
 		self,
-		hole_cards: list[Card],
-		board: list[Card]
+		hole_cards: tuple[Card, ...],
+		board: tuple[Card, ...]
 	) -> float:
 		"""
 		Calculate equity via vectorized Monte Carlo simulation.
 
 		Uses numpy for efficient batch sampling of opponent hands and runouts.
 		"""
-		# Build list of available cards (excluding known cards)
-		dead_cards = set(hole_cards) | set(board)
-		available = [
-			Card(rank, suit)
-			for suit in Suit
-			for rank in Rank
-			if Card(rank, suit) not in dead_cards
-		]
-
-		num_available = len(available)
+		# Available card indices: mark dead cards in a 52-bit mask and
+		# keep the cards whose bit is clear
+		hole_idx = np.array([card_index(c) for c in hole_cards], dtype=np.int64)
+		board_idx = np.array([card_index(c) for c in board], dtype=np.int64)
+
+		dead_mask = 0
+		for idx in hole_idx:
+			dead_mask |= 1 << idx
+		for idx in board_idx:
+			dead_mask |= 1 << idx
+		available_idx = ALL_CARDS[(dead_mask >> ALL_CARDS) & 1 == 0]
+
+		num_available = available_idx.size
 		cards_needed = 5 - len(board)
 		sample_size = 2 + cards_needed
 
-		# Generate all random indices at once using numpy
+		# Sample all simulations in one shot: permute each row of the
+		# available cards independently and take the first sample_size.
 		# Each row is one simulation: [opp1, opp2, runout1, runout2, ...]
 		rng = np.random.default_rng()
-		all_indices = np.array([
-			rng.choice(num_available, size=sample_size, replace=False)
-			for _ in range(self._equity_samples)
-		])
-
-		# Track results
-		wins = 0
-		ties = 0
-
-		for indices in all_indices:
-			# Extract sampled cards
-			opp_cards = [available[indices[0]], available[indices[1]]]
-			runout = [available[idx] for idx in indices[2:]]
-			full_board = board + runout
-
-			# Evaluate hands
-			my_rank = HandEvaluator.evaluate(hole_cards, full_board).absolute_rank
-			opp_rank = HandEvaluator.evaluate(opp_cards, full_board).absolute_rank
-
-			if my_rank > opp_rank:
-				wins += 1
-			elif my_rank == opp_rank:
-				ties += 1
+		samples = rng.permuted(
+			np.broadcast_to(
+				available_idx, (self._equity_samples, num_available)
+			),
+			axis=1
+		)[:, :sample_size]
+
+		if _HAS_NUMBA:
+			return _equity_kernel(
+				hole_idx, board_idx, samples,
+				_TOP5_TABLE, _STRAIGHT_TABLE
+			)
+
+		# Assemble all N boards and evaluate both hands in bulk
+		opp_idx = samples[:, :2]
+		boards_idx = np.concatenate([
+			np.broadcast_to(
+				board_idx, (self._equity_samples, board_idx.size)
+			),
+			samples[:, 2:]
+		], axis=1)
+
+		my_ranks = HandEvaluator.evaluate_batch(hole_idx, boards_idx)
+		opp_ranks = HandEvaluator.evaluate_batch(opp_idx, boards_idx)
+
+		wins = int((my_ranks > opp_ranks).sum())
+		ties = int((my_ranks == opp_ranks).sum())
 
 		return (wins + ties * 0.5) / self._equity_samples
 
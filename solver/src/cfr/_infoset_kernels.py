@@ -0,0 +1,57 @@
+"""
+Numba-compiled kernels for InformationSet regret updates.
+
+Importing this module requires numba (optional, see requirements.txt);
+InformationSet falls back to its numpy implementations when the import
+fails. The kernels run the regret-matching math as plain scalar loops,
+which compile to a handful of machine instructions for the tiny (2-6
+action) arrays CFR touches per node.
+"""
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def regret_match(cumulative_regrets, out):
+	"""Write the regret-matching strategy for one infoset into out."""
+	n = cumulative_regrets.shape[0]
+
+	total = 0.0
+	for i in range(n):
+		value = cumulative_regrets[i]
+		positive = value if value > 0 else 0.0
+		out[i] = positive
+		total += positive
+
+	if total > 0:
+		for i in range(n):
+			out[i] /= total
+	else:
+		uniform = 1.0 / n
+		for i in range(n):
+			out[i] = uniform
+
+
+@njit(cache=True, fastmath=True)
+def update_regrets(cumulative_regrets, scratch, action_utilities, cf_reach):
+	"""
+	CFR+ regret update for one infoset, in place.
+
+	Computes the current strategy, the expected utility under it, and
+	the clamped reach-weighted regret accumulation in a single pass.
+	Returns the expected utility.
+	"""
+	n = cumulative_regrets.shape[0]
+	regret_match(cumulative_regrets, scratch)
+
+	expected_utility = 0.0
+	for i in range(n):
+		expected_utility += scratch[i] * action_utilities[i]
+
+	for i in range(n):
+		updated = cumulative_regrets[i] + cf_reach * (
+			action_utilities[i] - expected_utility
+		)
+		cumulative_regrets[i] = updated if updated > 0 else 0.0
+
+	return expected_utility
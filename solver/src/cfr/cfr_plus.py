@@ -5,7 +5,7 @@ Implements the CFR+ algorithm for finding Nash equilibrium strategies
 in extensive-form games like poker.
 """
 
-import random
+from pathlib import Path
 from typing import Optional
 import numpy as np
 from tqdm import tqdm
@@ -52,6 +52,9 @@ class CFRPlusSolver:
 		self._iteration = 0
 		self._total_utility = 0.0
 
+		# Per-depth action-utility buffers reused across traversals
+		self._utility_stack: list[np.ndarray] = []
+
 	def train(
 		self,
 		iterations: int,
@@ -71,7 +74,14 @@ class CFRPlusSolver:
 		Returns:
 			Average game value
 		"""
-		iterator = tqdm(range(iterations)) if verbose else range(iterations)
+		iterator = (
+			tqdm(
+				range(iterations),
+				miniters=max(1, iterations // 200),
+				mininterval=0.25
+			)
+			if verbose else range(iterations)
+		)
 
 		for i in iterator:
 			self._iteration = i + 1
@@ -87,12 +97,19 @@ class CFRPlusSolver:
 			)
 
 			# CFR traversal from root
-			reach_probs = np.ones(2)
-			utility = self._cfr_traverse(game_state, reach_probs, 0)
+			utility = self._cfr_traverse(game_state, 1.0, 1.0, 0)
 			self._total_utility += utility
 
-			# Update progress bar
-			if verbose and isinstance(iterator, tqdm):
+			# Periodic checkpoint for warm-start restarts
+			if (
+				output_dir is not None
+				and self._iteration % checkpoint_every == 0
+			):
+				self.save(str(Path(output_dir) / 'cfr_checkpoint'))
+
+			# Update progress bar (throttled: postfix formatting per
+			# iteration costs more than a CFR iteration at small trees)
+			if verbose and (i & 1023) == 0 and isinstance(iterator, tqdm):
 				iterator.set_postfix({
 					'infosets': len(self.infoset_manager),
 					'avg_util': self._total_utility / (i + 1)
@@ -110,16 +127,24 @@ class CFRPlusSolver:
 	def _cfr_traverse(
 		self,
 		game_state: GameState,
-		reach_probs: np.ndarray,
-		traversing_player: int
+		reach_0: float,
+		reach_1: float,
+		traversing_player: int,
+		depth: int = 0
 	) -> float:
 		"""
 		Recursive CFR traversal.
 
+		Reach probabilities are passed as two scalars and action
+		utilities live in per-depth buffers, so no arrays are
+		allocated per node.
+
 		Args:
 			game_state: Current game state
-			reach_probs: Reach probabilities for each player
+			reach_0: Reach probability for player 0
+			reach_1: Reach probability for player 1
 			traversing_player: Player whose utility we're computing
+			depth: Recursion depth (selects the utility buffer)
 
 		Returns:
 			Expected utility for traversing player
@@ -129,7 +154,6 @@ class CFRPlusSolver:
 			return game_state.get_payoff(traversing_player)
 
 		current_player = game_state.current_player
-		opponent = 1 - current_player
 
 		# Get abstract actions
 		actions = self.action_abstraction.get_abstract_actions(game_state)
@@ -142,45 +166,54 @@ class CFRPlusSolver:
 		# Build information set key
 		infoset_key = self._build_infoset_key(game_state, current_player)
 
-		# Get or create information set
-		infoset = self.infoset_manager.get_or_create(infoset_key, num_actions)
+		# Get or create information set row
+		row = self.infoset_manager.get_or_create(infoset_key, num_actions)
 
 		# Get current strategy
-		strategy = infoset.get_strategy(reach_probs[current_player])
-
-		# Compute counterfactual values for each action
-		action_utilities = np.zeros(num_actions)
+		my_reach = reach_0 if current_player == 0 else reach_1
+		strategy = self.infoset_manager.current_strategy(row, my_reach)
+
+		# Counterfactual values for each action (reused buffer)
+		if depth == len(self._utility_stack):
+			self._utility_stack.append(np.empty(max(16, num_actions)))
+		buffer = self._utility_stack[depth]
+		if buffer.shape[0] < num_actions:
+			buffer = np.empty(num_actions)
+			self._utility_stack[depth] = buffer
+		action_utilities = buffer[:num_actions]
 
 		for i, action in enumerate(actions):
-			# Apply action
+			# Apply action and recurse with the updated reach
 			new_state = game_state.apply_action(action)
-
-			# Update reach probabilities
-			new_reach = reach_probs.copy()
-			new_reach[current_player] *= strategy[i]
-
-			# Recurse
-			action_utilities[i] = self._cfr_traverse(
-				new_state, new_reach, traversing_player
-			)
-
-		# Compute expected utility
-		node_utility = np.dot(strategy, action_utilities)
+			prob = strategy[i]
+
+			if current_player == 0:
+				action_utilities[i] = self._cfr_traverse(
+					new_state, reach_0 * prob, reach_1,
+					traversing_player, depth + 1
+				)
+			else:
+				action_utilities[i] = self._cfr_traverse(
+					new_state, reach_0, reach_1 * prob,
+					traversing_player, depth + 1
+				)
+
+		# Compute expected utility. For the common tiny fanout, an
+		# unrolled scalar sum beats np.dot's per-call overhead.
+		if num_actions <= 4:
+			node_utility = 0.0
+			for i in range(num_actions):
+				node_utility += strategy[i] * action_utilities[i]
+		else:
+			node_utility = np.dot(strategy, action_utilities)
 
 		# Update regrets if this is the traversing player's decision
 		if current_player == traversing_player:
 			# Counterfactual reach is opponent's reach probability
-			cf_reach = reach_probs[opponent]
+			cf_reach = reach_1 if current_player == 0 else reach_0
 
-			# Compute regrets
-			regrets = action_utilities - node_utility
-
-			# Update information set
-			infoset.cumulative_regrets += cf_reach * regrets
-
-			# CFR+ floor
-			infoset.cumulative_regrets = np.maximum(
-				0, infoset.cumulative_regrets
+			self.infoset_manager.update_regrets(
+				row, action_utilities, node_utility, cf_reach
 			)
 
 		return node_utility
@@ -189,11 +222,12 @@ class CFRPlusSolver:
 		self,
 		game_state: GameState,
 		player: int
-	) -> str:
+	) -> tuple[int, int, str]:
 		"""
 		Build unique key for information set.
 
-		Combines hand bucket, street, and action history.
+		Packs (hand bucket, street, action history) into a tuple,
+		avoiding per-node string formatting.
 		"""
 		# Get hand bucket
 		bucket = self.hand_bucketing.get_bucket(
@@ -201,13 +235,12 @@ class CFRPlusSolver:
 			game_state.community_cards if game_state.community_cards else None
 		)
 
-		# Encode action history
-		history = game_state.encode_history()
+		return (bucket, game_state.street.value, game_state.encode_history())
 
-		# Combine into key
-		return f'{bucket}:{game_state.street.name}:{history}'
-
-	def get_strategy(self, infoset_key: str) -> Optional[np.ndarray]:
+	def get_strategy(
+		self,
+		infoset_key: tuple[int, int, str]
+	) -> Optional[np.ndarray]:
 		"""
 		Get the computed strategy for an information set.
 
@@ -216,6 +249,19 @@ class CFRPlusSolver:
 		"""
 		return self.infoset_manager.get_strategy(infoset_key)
 
+	def save(self, path: str) -> None:
+		"""Persist regret/strategy tables under the given path prefix."""
+		self.infoset_manager.save(path)
+
+	def load(self, path: str, mmap: bool = True) -> None:
+		"""
+		Warm-start from previously saved tables.
+
+		With mmap=True the tables are memory-mapped, so loading is
+		nearly free and further training updates the mapped pages.
+		"""
+		self.infoset_manager.load(path, mmap=mmap)
+
 	def get_game_value(self) -> float:
 		"""Get average game value from training."""
 		if self._iteration == 0:
@@ -241,6 +287,12 @@ class KuhnCFRSolver:
 
 	ACTIONS = ['bet', 'check']  # or pass
 
+	# All 6 possible (player0, player1) deals from {J, Q, K}
+	DEALS = (
+		('J', 'Q'), ('J', 'K'), ('Q', 'J'),
+		('Q', 'K'), ('K', 'J'), ('K', 'Q')
+	)
+
 	def __init__(self):
 		"""Initialize Kuhn poker CFR solver."""
 		self.infoset_map: dict[str, InformationSet] = {}
@@ -257,12 +309,12 @@ class KuhnCFRSolver:
 		Returns:
 			Average game value for player 0
 		"""
-		cards = ['J', 'Q', 'K']
+		# Pre-generate every deal in one vectorized RNG call instead
+		# of a per-iteration random.shuffle
+		deal_ids = np.random.default_rng().integers(0, 6, size=iterations)
 
-		for _ in range(iterations):
-			# Shuffle and deal
-			random.shuffle(cards)
-			dealt = cards[:2]  # Player 0 and 1 get one card each
+		for deal_id in deal_ids.tolist():
+			dealt = self.DEALS[deal_id]
 
 			# CFR from root
 			utility = self._cfr(dealt, '', np.ones(2), 0)
@@ -273,7 +325,7 @@ class KuhnCFRSolver:
 
 	def _cfr(
 		self,
-		cards: list[str],
+		cards: tuple[str, str],
 		history: str,
 		reach_probs: np.ndarray,
 		active_player: int
@@ -282,7 +334,7 @@ class KuhnCFRSolver:
 		CFR traversal for Kuhn poker.
 
 		Args:
-			cards: [player0_card, player1_card]
+			cards: (player0_card, player1_card)
 			history: Action history string
 			reach_probs: Reach probabilities
 			active_player: Current player
@@ -305,33 +357,28 @@ class KuhnCFRSolver:
 
 		# Get strategy
 		strategy = infoset.get_strategy(reach_probs[active_player])
+		p_bet = strategy[0]
+		p_check = strategy[1]
 
-		# Compute action utilities
-		action_utilities = np.zeros(2)
+		# Compute action utilities as plain scalars; with exactly two
+		# actions, numpy's per-op overhead dwarfs the arithmetic
 
-		for i, action in enumerate(self.ACTIONS):
-			action_char = 'b' if action == 'bet' else 'c'
-			new_history = history + action_char
+		reach_bet = reach_probs.copy()
+		reach_bet[active_player] *= p_bet
+		u_bet = -self._cfr(cards, history + 'b', reach_bet, opponent)
 
-			# Update reach probabilities
-			new_reach = reach_probs.copy()
-			new_reach[active_player] *= strategy[i]
-
-			# Recurse (note: Kuhn alternates players)
-			action_utilities[i] = -self._cfr(
-				cards, new_history, new_reach, opponent
-			)
+		reach_check = reach_probs.copy()
+		reach_check[active_player] *= p_check
+		u_check = -self._cfr(cards, history + 'c', reach_check, opponent)
 
 		# Expected utility
-		node_utility = np.dot(strategy, action_utilities)
+		node_utility = p_bet * u_bet + p_check * u_check
 
-		# Update regrets
+		# Update regrets with scalar stores, applying the CFR+ floor inline
 		cf_reach = reach_probs[opponent]
-		regrets = action_utilities - node_utility
-		infoset.cumulative_regrets += cf_reach * regrets
-
-		# CFR+ floor
-		infoset.cumulative_regrets = np.maximum(0, infoset.cumulative_regrets)
+		regrets = infoset.cumulative_regrets
+		regrets[0] = max(0.0, regrets[0] + cf_reach * (u_bet - node_utility))
+		regrets[1] = max(0.0, regrets[1] + cf_reach * (u_check - node_utility))
 
 		return node_utility
 
@@ -339,7 +386,7 @@ class KuhnCFRSolver:
 		"""Check if game has ended."""
 		return history in ['bc', 'bb', 'cc', 'cbb', 'cbc']
 
-	def _get_payoff(self, history: str, cards: list[str]) -> float:
+	def _get_payoff(self, history: str, cards: tuple[str, str]) -> float:
 		"""
 		Get payoff for the ACTIVE player at terminal state.
 
@@ -4,6 +4,7 @@ Deep CFR implementation using neural network function approximation.
 Uses PyTorch with ROCm support for AMD GPU acceleration.
 """
 
+import multiprocessing
 import random
 from typing import Optional
 import numpy as np
@@ -12,6 +13,7 @@ import torch.nn as nn
 import torch.optim as optim
 from tqdm import tqdm
 
+from .information_set import _uniform
 from ..enums import Rank, Suit
 from ..game.card import Card
 from ..game.deck import Deck
@@ -38,7 +40,9 @@ class DeepCFR:
 		action_abstraction: Optional[ActionAbstraction] = None,
 		big_blind: int = 2,
 		starting_stack: int = 200,
-		device: Optional[str] = None
+		device: Optional[str] = None,
+		num_workers: int = 1,
+		compile_networks: bool = True
 	):
 		"""
 		Initialize Deep CFR.
@@ -49,12 +53,18 @@ class DeepCFR:
 			big_blind: Big blind size
 			starting_stack: Starting stack per player
 			device: Torch device ('cuda', 'cpu', or None for auto)
+			num_workers: Worker processes for traversals (1 = in-process)
+			compile_networks: Wrap networks in torch.compile
 		"""
 		self.hand_bucketing = hand_bucketing or HandBucketing()
 		self.action_abstraction = action_abstraction or ActionAbstraction()
 		self.big_blind = big_blind
 		self.starting_stack = starting_stack
 
+		# Feature rows carry histories at this fixed length so batches
+		# stack with one C-level copy and tensor shapes stay static
+		self.max_history_len = 40
+
 		# Auto-detect device (ROCm maps to 'cuda' in PyTorch)
 		if device is None:
 			self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
@@ -63,6 +73,10 @@ class DeepCFR:
 
 		print(f'Using device: {self.device}')
 
+		# Allow TF32 on tensor cores for the FP32 matmuls these small
+		# MLPs are made of (no-op on devices without them)
+		torch.set_float32_matmul_precision('high')
+
 		# Value networks for each player
 		self.value_networks = [
 			PokerValueNetwork().to(self.device),
@@ -72,6 +86,26 @@ class DeepCFR:
 		# Strategy network (used at inference time)
 		self.strategy_network = PokerValueNetwork().to(self.device)
 
+		# Keep eager handles for checkpointing/export (compiled
+		# wrappers prefix state_dict keys), then compile for runtime:
+		# these MLPs are dispatch-bound, so fusing the forward pays off.
+		# Default mode, not reduce-overhead: the scheduler shrinks the
+		# batch as traversals finish, so CUDA-graph capture would
+		# re-record at every new shape and cost more than it saves
+		self._eager_value_networks = list(self.value_networks)
+		self._eager_strategy_network = self.strategy_network
+		self.num_actions = self._eager_strategy_network.num_actions
+		if compile_networks:
+			try:
+				self.value_networks = [
+					torch.compile(net) for net in self.value_networks
+				]
+				self.strategy_network = torch.compile(self.strategy_network)
+			except Exception:
+				# torch.compile is best-effort; eager modules still work
+				self.value_networks = self._eager_value_networks
+				self.strategy_network = self._eager_strategy_network
+
 		# Optimizers
 		self.value_optimizers = [
 			optim.Adam(net.parameters(), lr=1e-3)
@@ -90,6 +124,37 @@ class DeepCFR:
 		# Buffer for strategy samples
 		self.strategy_buffer = ReservoirBuffer(max_size=2_000_000)
 
+		# Flat 52-card table plus one RNG: dealing indexes into this
+		# instead of building and shuffling a Deck per traversal
+		self._card_table = [
+			Card(rank=rank, suit=suit) for suit in Suit for rank in Rank
+		]
+		self._rng = np.random.default_rng()
+
+		# Bucket memo for feature extraction: within one hand the
+		# (hole, board) pair repeats at every decision node of a street,
+		# so cache ahead of HandBucketing's canonicalization. Cleared
+		# per traversal group to stay tiny.
+		self._bucket_cache: dict[tuple, int] = {}
+
+		# Reusable pinned host buffers for batched D2H copies (GPU
+		# only), one per player: both sub-batches of a scheduling step
+		# are alive at once, so they must not share a buffer
+		self._d2h_staging: list[Optional[torch.Tensor]] = [None, None]
+
+		# Traversals are embarrassingly parallel GIL-bound game logic,
+		# so optionally shard them across a pool of worker processes,
+		# each holding its own CPU solver built once at pool start
+		self.num_workers = num_workers
+		self._pool = None
+		if num_workers > 1:
+			context = multiprocessing.get_context('spawn')
+			self._pool = context.Pool(
+				num_workers,
+				initializer=_init_worker,
+				initargs=(self._worker_config(),)
+			)
+
 		self._iteration = 0
 
 	def train(
@@ -115,27 +180,31 @@ class DeepCFR:
 		for i in iterator:
 			self._iteration = i + 1
 
-			# Collect traversal samples
-			for t in range(traversals_per_iter):
-				# Alternate which player we're training
-				traversing_player = t % 2
-
-				# Deal random hands
-				hole_cards = self._deal_random_hands()
-
-				# Create initial state
-				game_state = GameState.new_hand(
-					hole_cards=hole_cards,
-					stacks=[self.starting_stack, self.starting_stack],
-					big_blind=self.big_blind
-				)
+			# Collect traversal samples in concurrently-scheduled groups
+			# so network inference is batched across traversals; train
+			# between groups, matching the old train_every cadence
+			for start in range(0, traversals_per_iter, train_every):
+				count = min(train_every, traversals_per_iter - start)
+
+				if self._pool is not None:
+					self._run_traversal_shards(count, start)
+				else:
+					states = []
+					players = []
+					for t in range(count):
+						# Alternate which player we're training
+						players.append((start + t) % 2)
+						states.append(GameState.new_hand(
+							hole_cards=self._deal_random_hands(),
+							stacks=[
+								self.starting_stack, self.starting_stack
+							],
+							big_blind=self.big_blind
+						))
+
+					self._run_traversals(states, players)
 
-				# Traverse game tree
-				self._cfr_traverse(game_state, traversing_player)
-
-				# Train networks periodically
-				if (t + 1) % train_every == 0:
-					self._train_networks(batch_size)
+				self._train_networks(batch_size)
 
 			# End of iteration: train more thoroughly
 			for _ in range(10):
@@ -149,25 +218,79 @@ class DeepCFR:
 					'strat_samples': len(self.strategy_buffer)
 				})
 
+	def _worker_config(self) -> dict:
+		"""Constructor arguments for per-worker CPU solvers."""
+		bucketing = self.hand_bucketing
+		abstraction = self.action_abstraction
+		return {
+			'preflop_buckets': bucketing._preflop_buckets,
+			'postflop_buckets': bucketing._postflop_buckets,
+			'equity_samples': bucketing._equity_samples,
+			'preflop_raise_sizes': abstraction._preflop_sizes,
+			'postflop_bet_sizes': abstraction._postflop_sizes,
+			'include_all_in': abstraction._include_all_in,
+			'big_blind': self.big_blind,
+			'starting_stack': self.starting_stack
+		}
+
+	def _run_traversal_shards(self, count: int, offset: int) -> None:
+		"""
+		Split a traversal group across the worker pool, merge samples.
+
+		Workers receive the latest value-network weights with each group,
+		so sampling-policy staleness is bounded by one group.
+		"""
+		value_states = [
+			{key: value.cpu() for key, value in net.state_dict().items()}
+			for net in self._eager_value_networks
+		]
+
+		shards = []
+		base, extra = divmod(count, self.num_workers)
+		start = offset
+		for worker in range(self.num_workers):
+			size = base + (1 if worker < extra else 0)
+			if size > 0:
+				shards.append((value_states, size, start))
+				start += size
+
+		for adv_0, adv_1, strat in self._pool.map(_run_worker_shard, shards):
+			for sample in adv_0:
+				self.advantage_buffers[0].add(sample)
+			for sample in adv_1:
+				self.advantage_buffers[1].add(sample)
+			for sample in strat:
+				self.strategy_buffer.add(sample)
+
 	def _deal_random_hands(self) -> tuple[list[Card], list[Card]]:
-		"""Deal random hole cards."""
-		deck = Deck().shuffle()
-		return (deck.deal(2), deck.deal(2))
+		"""Deal random hole cards (one C-level draw, no Deck)."""
+		idx = self._rng.choice(52, size=4, replace=False)
+		table = self._card_table
+		return (
+			[table[idx[0]], table[idx[1]]],
+			[table[idx[2]], table[idx[3]]]
+		)
 
 	def _cfr_traverse(
 		self,
 		game_state: GameState,
 		traversing_player: int
-	) -> float:
+	):
 		"""
 		Traverse game tree collecting advantage samples.
 
+		Implemented as a generator coroutine: each decision node yields
+		(game_state, player) and is sent back the raw network values
+		for that node. This lets the scheduler in _run_traversals park
+		many traversals at their current node and serve them all with
+		one batched forward pass instead of a 1-row predict per node.
+
 		Args:
 			game_state: Current state
 			traversing_player: Player we're optimizing for
 
 		Returns:
-			Expected utility
+			Expected utility (via StopIteration)
 		"""
 		if game_state.is_terminal:
 			return game_state.get_payoff(traversing_player)
@@ -178,9 +301,10 @@ class DeepCFR:
 		if not actions:
 			return 0.0
 
-		# Get strategy from network
-		strategy = self._get_network_strategy(game_state, current_player)
-		strategy = strategy[:len(actions)]  # Trim to valid actions
+		# Ask the scheduler for this node's network values, then
+		# regret-match them into a strategy
+		values = yield (game_state, current_player)
+		strategy = np.maximum(0, values[:len(actions)])
 		strategy = self._normalize(strategy)
 
 		if current_player == traversing_player:
@@ -189,7 +313,7 @@ class DeepCFR:
 
 			for i, action in enumerate(actions):
 				new_state = game_state.apply_action(action)
-				action_values[i] = self._cfr_traverse(
+				action_values[i] = yield from self._cfr_traverse(
 					new_state, traversing_player
 				)
 
@@ -206,8 +330,17 @@ class DeepCFR:
 			return expected_value
 
 		else:
-			# Opponent: sample according to strategy
-			action_idx = np.random.choice(len(actions), p=strategy)
+			# Opponent: sample according to strategy. Inverse-CDF walk
+			# over the handful of actions beats np.random.choice, which
+			# validates and renormalizes p on every call
+			r = random.random()
+			cumulative = 0.0
+			action_idx = len(actions) - 1
+			for i in range(len(actions)):
+				cumulative += strategy[i]
+				if r < cumulative:
+					action_idx = i
+					break
 			action = actions[action_idx]
 
 			# Store strategy sample
@@ -217,29 +350,147 @@ class DeepCFR:
 			self.strategy_buffer.add(sample)
 
 			new_state = game_state.apply_action(action)
-			return self._cfr_traverse(new_state, traversing_player)
+			return (yield from self._cfr_traverse(
+				new_state, traversing_player
+			))
 
-	def _get_network_strategy(
+	def _run_traversals(
 		self,
-		game_state: GameState,
+		game_states: list[GameState],
+		traversing_players: list[int]
+	) -> None:
+		"""
+		Run a group of traversals concurrently with batched inference.
+
+		Each active traversal sits parked at one decision node per
+		scheduling step; all parked nodes are answered together by
+		_batched_values, then every traversal advances to its next
+		node. Kernel-launch count drops from one per node to one per
+		player per step.
+		"""
+		self._bucket_cache.clear()
+
+		active = []
+		for state, player in zip(game_states, traversing_players):
+			gen = self._cfr_traverse(state, player)
+			try:
+				request = next(gen)
+			except StopIteration:
+				continue
+			active.append((gen, request))
+
+		while active:
+			values = self._batched_values([req for _, req in active])
+
+			next_active = []
+			for (gen, _), row in zip(active, values):
+				try:
+					request = gen.send(row)
+				except StopIteration:
+					continue
+				next_active.append((gen, request))
+			active = next_active
+
+	def _batched_values(
+		self,
+		requests: list[tuple[GameState, int]]
+	) -> list[np.ndarray]:
+		"""
+		Evaluate parked decision nodes with one forward per network.
+		"""
+		results: list[Optional[np.ndarray]] = [None] * len(requests)
+
+		for player in range(2):
+			indices = [
+				i for i, (_, p) in enumerate(requests) if p == player
+			]
+			if not indices:
+				continue
+
+			features = [
+				self._extract_features(requests[i][0], player)
+				for i in indices
+			]
+			batch = self._batch_feature_tensors(features)
+
+			network = self.value_networks[player]
+			if network.training:
+				network.eval()
+			with torch.inference_mode(), self._autocast():
+				values = network(*batch)
+
+			values_np = self._values_to_numpy(values, player)
+			for row, i in enumerate(indices):
+				results[i] = values_np[row]
+
+		return results
+
+	def _batch_feature_tensors(self, features: list[dict]) -> tuple:
+		"""Assemble extracted features into device tensors (see
+		_train_network for the same buffer layout)."""
+		batch = len(features)
+
+		buckets = np.empty(batch, dtype=np.int64)
+		streets = np.empty(batch, dtype=np.int64)
+		pots = np.empty((batch, 4), dtype=np.float32)
+		lengths = np.empty(batch, dtype=np.int64)
+
+		# Histories are fixed-length rows, so stacking is one C copy
+		histories = np.stack(
+			[f['action_history'] for f in features]
+		).astype(np.int64)
+
+		for i, feature in enumerate(features):
+			buckets[i] = feature['bucket']
+			streets[i] = feature['street']
+			pots[i] = feature['pot_features']
+			lengths[i] = feature['history_len']
+
+		return (
+			self._to_device(buckets),
+			self._to_device(streets),
+			self._to_device(pots),
+			self._to_device(histories),
+			self._to_device(lengths)
+		)
+
+	def _values_to_numpy(
+		self,
+		values: torch.Tensor,
 		player: int
 	) -> np.ndarray:
-		"""Get strategy from value network."""
-		features = self._extract_features(game_state, player)
-
-		with torch.no_grad():
-			values = self.value_networks[player].predict(
-				bucket=features['bucket'],
-				street=features['street'],
-				pot_features=features['pot_features'],
-				action_history=features['action_history'],
-				device=self.device
+		"""
+		Copy a batch of network outputs to host memory.
+
+		On CPU this is a zero-copy view. On GPU each batch lands in a
+		persistent pinned staging buffer (grown as needed), so the
+		device-to-host transfer reuses pinned pages and syncs once per
+		batch instead of allocating fresh pageable memory every call.
+		The buffers are per player because one scheduling step runs both
+		players' sub-batches and consumes all rows afterwards — a shared
+		buffer would let the second copy clobber the first player's rows
+		before the traversals read them. The result aliases the player's
+		staging buffer: consume it before that player's next batch.
+		"""
+		values = values.float()
+		if self.device == 'cpu':
+			return values.numpy()
+
+		rows, cols = values.shape
+		staging = self._d2h_staging[player]
+		if (
+			staging is None
+			or staging.shape[0] < rows
+			or staging.shape[1] != cols
+		):
+			staging = torch.empty(
+				rows, cols, dtype=torch.float32, pin_memory=True
 			)
+			self._d2h_staging[player] = staging
 
-		# Convert advantages to strategy via regret matching
-		values_np = values.cpu().numpy()
-		strategy = np.maximum(0, values_np)
-		return self._normalize(strategy)
+		host = staging[:rows]
+		host.copy_(values)
+		return host.numpy()
 
 	def _extract_features(
 		self,
@@ -247,10 +498,16 @@ class DeepCFR:
 		player: int
 	) -> dict:
 		"""Extract neural network features from game state."""
-		bucket = self.hand_bucketing.get_bucket(
-			game_state.hole_cards[player],
-			game_state.community_cards if game_state.community_cards else None
-		)
+		hole = game_state.hole_cards[player]
+		board = game_state.community_cards
+
+		bucket_key = (hole[0], hole[1], tuple(board))
+		bucket = self._bucket_cache.get(bucket_key)
+		if bucket is None:
+			bucket = self.hand_bucketing.get_bucket(
+				hole, board if board else None
+			)
+			self._bucket_cache[bucket_key] = bucket
 
 		street = game_state.street.value
 
@@ -263,24 +520,24 @@ class DeepCFR:
 			game_state.bets_this_round[player] / max(1, game_state.pot)
 		]
 
-		# Encode action history as indices
-		actions = self.action_abstraction.get_abstract_actions(game_state)
-		action_history = []
-		for action in game_state.action_history:
+		# Encode action history into a fixed-length int16 row; padding
+		# falls out of the zero initialization
+		history = np.zeros(self.max_history_len, dtype=np.int16)
+		count = 0
+		for action in game_state.action_history[:self.max_history_len]:
 			try:
 				idx = self.action_abstraction.encode_action(action, game_state)
-				action_history.append(idx + 1)  # +1 for 0 padding
+				history[count] = idx + 1  # +1 for 0 padding
 			except ValueError:
-				action_history.append(0)
-
-		if not action_history:
-			action_history = [0]
+				history[count] = 0
+			count += 1
 
 		return {
 			'bucket': bucket,
 			'street': street,
 			'pot_features': pot_features,
-			'action_history': action_history
+			'action_history': history,
+			'history_len': max(count, 1)
 		}
 
 	def _create_sample(
@@ -291,7 +548,12 @@ class DeepCFR:
 	) -> tuple:
 		"""Create training sample from game state."""
 		features = self._extract_features(game_state, player)
-		return (features, target.copy())
+
+		# Store targets pre-padded to network width so training batches
+		# stack them directly instead of zero-padding per sample
+		padded = np.zeros(self.num_actions, dtype=np.float32)
+		padded[:len(target)] = target
+		return (features, padded)
 
 	def _train_networks(self, batch_size: int) -> None:
 		"""Train value and strategy networks."""
@@ -323,57 +585,44 @@ class DeepCFR:
 		samples: list
 	) -> float:
 		"""Train a network on batch of samples."""
-		network.train()
-
-		# Prepare batch
-		buckets = []
-		streets = []
-		pot_features = []
-		histories = []
-		lengths = []
-		targets = []
-
-		max_len = 1
-
-		for features, target in samples:
-			buckets.append(features['bucket'])
-			streets.append(features['street'])
-			pot_features.append(features['pot_features'])
-			histories.append(features['action_history'])
-			lengths.append(len(features['action_history']))
-			targets.append(target)
-			max_len = max(max_len, len(features['action_history']))
-
-		# Pad histories
-		padded_histories = []
-		for h in histories:
-			padded = h + [0] * (max_len - len(h))
-			padded_histories.append(padded)
-
-		# Convert to tensors
-		bucket_t = torch.tensor(buckets, device=self.device)
-		street_t = torch.tensor(streets, device=self.device)
-		pot_t = torch.tensor(
-			pot_features, dtype=torch.float32, device=self.device
-		)
-		history_t = torch.tensor(padded_histories, device=self.device)
-		length_t = torch.tensor(lengths, device=self.device)
-
-		# Pad targets to network output size
-		padded_targets = []
-		for t in targets:
-			padded = np.zeros(network.num_actions)
-			padded[:len(t)] = t
-			padded_targets.append(padded)
-		target_t = torch.tensor(
-			padded_targets, dtype=torch.float32, device=self.device
-		)
-
-		# Forward pass
-		predictions = network(bucket_t, street_t, pot_t, history_t, length_t)
-
-		# MSE loss
-		loss = nn.functional.mse_loss(predictions, target_t)
+		if not network.training:
+			network.train()
+
+		batch = len(samples)
+
+		# Preallocate the batch buffers at final shape and fill them in
+		# a single pass; the fixed-length history rows stack directly
+		buckets = np.empty(batch, dtype=np.int64)
+		streets = np.empty(batch, dtype=np.int64)
+		pots = np.empty((batch, 4), dtype=np.float32)
+		lengths = np.empty(batch, dtype=np.int64)
+
+		histories = np.stack(
+			[features['action_history'] for features, _ in samples]
+		).astype(np.int64)
+		targets = np.stack([target for _, target in samples])
+
+		for i, (features, _) in enumerate(samples):
+			buckets[i] = features['bucket']
+			streets[i] = features['street']
+			pots[i] = features['pot_features']
+			lengths[i] = features['history_len']
+
+		# Convert to tensors (from_numpy shares the buffers, no copy)
+		bucket_t = self._to_device(buckets)
+		street_t = self._to_device(streets)
+		pot_t = self._to_device(pots)
+		history_t = self._to_device(histories)
+		length_t = self._to_device(lengths)
+		target_t = self._to_device(targets)
+
+		# Forward pass and loss under bf16 autocast on GPU (parameters
+		# stay FP32; MSE is safe in bf16 and needs no grad scaler)
+		with self._autocast():
+			predictions = network(
+				bucket_t, street_t, pot_t, history_t, length_t
+			)
+			loss = nn.functional.mse_loss(predictions, target_t)
 
 		# Backward pass
 		optimizer.zero_grad()
@@ -382,12 +631,39 @@ class DeepCFR:
 
 		return loss.item()
 
+	def _autocast(self) -> torch.autocast:
+		"""bf16 autocast context for GPU devices, disabled on CPU."""
+		return torch.autocast(
+			device_type='cuda',
+			dtype=torch.bfloat16,
+			enabled=self.device != 'cpu'
+		)
+
+	def _to_device(self, array: np.ndarray) -> torch.Tensor:
+		"""
+		Move a numpy batch buffer to the training device.
+
+		On GPU devices the tensor is staged through pinned host memory
+		and copied with non_blocking=True, so the transfer overlaps the
+		previous batch's backward pass on the copy engine. On CPU this
+		is just a zero-copy view.
+		"""
+		tensor = torch.from_numpy(array)
+		if self.device == 'cpu':
+			return tensor
+		return tensor.pin_memory().to(self.device, non_blocking=True)
+
 	def _normalize(self, strategy: np.ndarray) -> np.ndarray:
-		"""Normalize to valid probability distribution."""
-		total = np.sum(strategy)
+		"""
+		Normalize to valid probability distribution.
+
+		The all-zero fallback returns the shared read-only uniform
+		array instead of allocating a fresh one per call.
+		"""
+		total = strategy.sum()
 		if total > 0:
 			return strategy / total
-		return np.ones(len(strategy)) / len(strategy)
+		return _uniform(len(strategy))
 
 	def get_strategy(
 		self,
@@ -406,25 +682,28 @@ class DeepCFR:
 		"""
 		features = self._extract_features(game_state, player)
 
-		with torch.no_grad():
-			self.strategy_network.eval()
+		history = features['action_history'][:features['history_len']]
+		with torch.inference_mode(), self._autocast():
 			values = self.strategy_network.predict(
 				bucket=features['bucket'],
 				street=features['street'],
 				pot_features=features['pot_features'],
-				action_history=features['action_history'],
+				action_history=history.tolist(),
 				device=self.device
 			)
 
-		# Convert to probabilities
+		# Convert to probabilities (float() first: under the bf16
+		# autocast the result dtype has no numpy equivalent)
 		probs = torch.softmax(values, dim=-1)
-		return probs.cpu().numpy()
+		return probs.float().cpu().numpy()
 
 	def save(self, path: str) -> None:
 		"""Save model checkpoints."""
 		torch.save({
-			'value_networks': [n.state_dict() for n in self.value_networks],
-			'strategy_network': self.strategy_network.state_dict(),
+			'value_networks': [
+				n.state_dict() for n in self._eager_value_networks
+			],
+			'strategy_network': self._eager_strategy_network.state_dict(),
 			'iteration': self._iteration
 		}, path)
 
@@ -432,10 +711,14 @@ class DeepCFR:
 		"""Load model checkpoints."""
 		checkpoint = torch.load(path, map_location=self.device)
 
+		# Compiled wrappers share parameters with the eager modules,
+		# so loading into the eager side updates both
 		for i, state_dict in enumerate(checkpoint['value_networks']):
-			self.value_networks[i].load_state_dict(state_dict)
+			self._eager_value_networks[i].load_state_dict(state_dict)
 
-		self.strategy_network.load_state_dict(checkpoint['strategy_network'])
+		self._eager_strategy_network.load_state_dict(
+			checkpoint['strategy_network']
+		)
 		self._iteration = checkpoint['iteration']
 
 	def export_to_onnx(self, output_dir: str) -> dict[str, str]:
@@ -450,9 +733,64 @@ class DeepCFR:
 		"""
 
 		return export_deep_cfr_models(
-			value_networks=self.value_networks,
-			strategy_network=self.strategy_network,
+			value_networks=self._eager_value_networks,
+			strategy_network=self._eager_strategy_network,
 			output_dir=output_dir,
 			iteration=self._iteration
 		)
 
+
+# Per-process solver for pool workers; built once by _init_worker so
+# bucketing caches and networks survive across shards
+_WORKER: Optional[DeepCFR] = None
+
+
+def _init_worker(config: dict) -> None:
+	"""Build the worker's CPU solver from plain constructor arguments."""
+	global _WORKER
+	_WORKER = DeepCFR(
+		hand_bucketing=HandBucketing(
+			preflop_buckets=config['preflop_buckets'],
+			postflop_buckets=config['postflop_buckets'],
+			equity_samples=config['equity_samples']
+		),
+		action_abstraction=ActionAbstraction(
+			preflop_raise_sizes=list(config['preflop_raise_sizes']),
+			postflop_bet_sizes=list(config['postflop_bet_sizes']),
+			include_all_in=config['include_all_in']
+		),
+		big_blind=config['big_blind'],
+		starting_stack=config['starting_stack'],
+		device='cpu',
+		compile_networks=False
+	)
+
+
+def _run_worker_shard(args: tuple) -> tuple[list, list, list]:
+	"""Run one shard of traversals and return the collected samples."""
+	value_states, count, offset = args
+	solver = _WORKER
+
+	for network, state in zip(solver._eager_value_networks, value_states):
+		network.load_state_dict(state)
+
+	states = []
+	players = []
+	for t in range(count):
+		players.append((offset + t) % 2)
+		states.append(GameState.new_hand(
+			hole_cards=solver._deal_random_hands(),
+			stacks=[solver.starting_stack, solver.starting_stack],
+			big_blind=solver.big_blind
+		))
+	solver._run_traversals(states, players)
+
+	samples = (
+		list(solver.advantage_buffers[0].buffer),
+		list(solver.advantage_buffers[1].buffer),
+		list(solver.strategy_buffer.buffer)
+	)
+	for buffer in (*solver.advantage_buffers, solver.strategy_buffer):
+		buffer.clear()
+	return samples
+
@@ -5,8 +5,26 @@ An information set represents what a player knows at a decision point:
 their cards and the action history, but not the opponent's cards.
 """
 
+import pickle
+from functools import lru_cache
+from typing import Hashable, Optional
+
 import numpy as np
-from typing import Optional
+
+# Numba is optional (see requirements.txt); the numpy path is the fallback
+try:
+	from . import _infoset_kernels as _kernels
+	_HAS_NUMBA = True
+except ImportError:
+	_HAS_NUMBA = False
+
+
+@lru_cache(maxsize=None)
+def _uniform(num_actions: int) -> np.ndarray:
+	"""Shared read-only uniform distribution for the zero-regret case."""
+	probs = np.full(num_actions, 1.0 / num_actions, dtype=np.float32)
+	probs.flags.writeable = False
+	return probs
 
 
 class InformationSet:
@@ -17,6 +35,10 @@ class InformationSet:
 	Implements CFR+ variant with non-negative regret clamping.
 	"""
 
+	__slots__ = (
+		'num_actions', 'cumulative_regrets', 'strategy_sum', '_scratch'
+	)
+
 	def __init__(self, num_actions: int):
 		"""
 		Initialize an information set.
@@ -25,8 +47,12 @@ class InformationSet:
 			num_actions: Number of available actions at this decision point
 		"""
 		self.num_actions = num_actions
-		self.cumulative_regrets = np.zeros(num_actions, dtype=np.float64)
-		self.strategy_sum = np.zeros(num_actions, dtype=np.float64)
+		self.cumulative_regrets = np.zeros(num_actions, dtype=np.float32)
+		self.strategy_sum = np.zeros(num_actions, dtype=np.float32)
+
+		# Scratch buffer reused by get_strategy/update_regrets so the
+		# per-node hot path allocates nothing
+		self._scratch = np.empty(num_actions, dtype=np.float32)
 
 	def get_strategy(self, reach_probability: float = 1.0) -> np.ndarray:
 		"""
@@ -34,6 +60,9 @@ class InformationSet:
 
 		CFR+ variant: uses max(0, regret) for each action.
 
+		The returned array is a reused internal buffer: read it or copy
+		it, but do not hold it across calls.
+
 		Args:
 			reach_probability: Probability of reaching this information set.
 								Used for strategy averaging.
@@ -41,15 +70,28 @@ class InformationSet:
 		Returns:
 			Probability distribution over actions
 		"""
-		# Regret matching: strategy proportional to positive regrets
-		strategy = np.maximum(0, self.cumulative_regrets)
-		strategy = self._normalize(strategy)
+		strategy = self._matched_strategy()
 
 		# Accumulate for average strategy computation
 		self.strategy_sum += reach_probability * strategy
 
 		return strategy
 
+	def _matched_strategy(self) -> np.ndarray:
+		"""Regret-matching into the scratch buffer (no allocation)."""
+		strategy = self._scratch
+		if _HAS_NUMBA:
+			_kernels.regret_match(self.cumulative_regrets, strategy)
+			return strategy
+
+		np.maximum(self.cumulative_regrets, 0, out=strategy)
+		total = strategy.sum()
+		if total > 0:
+			strategy /= total
+		else:
+			strategy.fill(1.0 / self.num_actions)
+		return strategy
+
 	def get_average_strategy(self) -> np.ndarray:
 		"""
 		Get the average strategy over all iterations.
@@ -73,19 +115,26 @@ class InformationSet:
 			action_utilities: Utility/EV for each action
 			counterfactual_reach: Opponent's reach probability
 		"""
+		if _HAS_NUMBA:
+			_kernels.update_regrets(
+				self.cumulative_regrets, self._scratch,
+				action_utilities, counterfactual_reach
+			)
+			return
+
 		# Compute expected utility under current strategy
-		strategy = np.maximum(0, self.cumulative_regrets)
-		strategy = self._normalize(strategy)
+		strategy = self._matched_strategy()
 		expected_utility = np.dot(strategy, action_utilities)
 
-		# Compute regret for each action
-		regrets = action_utilities - expected_utility
-
-		# CFR+: accumulate regrets weighted by counterfactual reach
-		self.cumulative_regrets += counterfactual_reach * regrets
-
-		# CFR+ floor: clamp cumulative regrets to non-negative
-		self.cumulative_regrets = np.maximum(0, self.cumulative_regrets)
+		# CFR+: accumulate reach-weighted regrets and clamp to
+		# non-negative, reusing the scratch buffer for the regrets
+		regrets = self._scratch
+		np.subtract(action_utilities, expected_utility, out=regrets)
+		regrets *= counterfactual_reach
+		self.cumulative_regrets += regrets
+		np.maximum(
+			self.cumulative_regrets, 0, out=self.cumulative_regrets
+		)
 
 	def _normalize(self, strategy: np.ndarray) -> np.ndarray:
 		"""
@@ -97,7 +146,7 @@ class InformationSet:
 		if total > 0:
 			return strategy / total
 		else:
-			return np.ones(self.num_actions) / self.num_actions
+			return _uniform(self.num_actions)
 
 	def __repr__(self) -> str:
 		avg = self.get_average_strategy()
@@ -106,70 +155,185 @@ class InformationSet:
 
 class InformationSetManager:
 	"""
-	Manages collection of information sets for CFR training.
+	Manages regret and strategy storage for CFR training.
 
-	Provides efficient lookup and creation of information sets.
+	Stores all information sets in dense structure-of-arrays tables
+	(one row per infoset) instead of per-infoset objects: millions of
+	small ndarrays cause GC pressure and pointer-chasing, while row
+	slices of two big tables stay cache-friendly and allocation-free.
 	"""
 
-	def __init__(self):
-		"""Initialize the information set manager."""
-		self._infosets: dict[str, InformationSet] = {}
+	__slots__ = ('_row_index', '_regrets', '_strategy_sum', '_num_actions')
 
-	def get_or_create(
-		self,
-		key: str,
-		num_actions: int
-	) -> InformationSet:
+	def __init__(self, initial_capacity: int = 1024, max_actions: int = 8):
 		"""
-		Get existing or create new information set.
+		Initialize the information set manager.
+
+		Args:
+			initial_capacity: Starting row count (grows by doubling)
+			max_actions: Starting column count (grows if exceeded)
+		"""
+		self._row_index: dict[Hashable, int] = {}
+
+		# float32 halves the footprint of the two big tables; regrets
+		# and strategy sums are normalized before use, so the extra
+		# float64 precision buys nothing here
+		self._regrets = np.zeros(
+			(initial_capacity, max_actions), dtype=np.float32
+		)
+		self._strategy_sum = np.zeros(
+			(initial_capacity, max_actions), dtype=np.float32
+		)
+		self._num_actions = np.zeros(initial_capacity, dtype=np.int8)
+
+	def get_or_create(self, key: Hashable, num_actions: int) -> int:
+		"""
+		Get existing or allocate a new information set row.
 
 		Args:
 			key: Unique identifier for the information set
 			num_actions: Number of actions (used only for creation)
 
 		Returns:
-			The InformationSet for this key
+			Row index into the regret/strategy tables
 		"""
-		if key not in self._infosets:
-			self._infosets[key] = InformationSet(num_actions)
-		return self._infosets[key]
+		row = self._row_index.get(key)
+		if row is not None:
+			return row
+
+		row = len(self._row_index)
+		if row == self._regrets.shape[0]:
+			self._grow_rows()
+		if num_actions > self._regrets.shape[1]:
+			self._grow_columns(num_actions)
+
+		self._row_index[key] = row
+		self._num_actions[row] = num_actions
+		return row
+
+	def _grow_rows(self) -> None:
+		"""Double table capacity (amortized O(1) insertion)."""
+		rows, cols = self._regrets.shape
+		for name in ('_regrets', '_strategy_sum'):
+			table = getattr(self, name)
+			grown = np.zeros((rows * 2, cols), dtype=table.dtype)
+			grown[:rows] = table
+			setattr(self, name, grown)
+		counts = np.zeros(rows * 2, dtype=np.int8)
+		counts[:rows] = self._num_actions
+		self._num_actions = counts
+
+	def _grow_columns(self, num_actions: int) -> None:
+		"""Widen tables for an infoset with more actions than seen."""
+		rows, cols = self._regrets.shape
+		for name in ('_regrets', '_strategy_sum'):
+			table = getattr(self, name)
+			grown = np.zeros((rows, num_actions), dtype=table.dtype)
+			grown[:, :cols] = table
+			setattr(self, name, grown)
+
+	def current_strategy(self, row: int, reach: float = 1.0) -> np.ndarray:
+		"""
+		Regret-matching strategy for a row (CFR+ variant).
 
-	def get(self, key: str) -> Optional[InformationSet]:
-		"""Get information set by key, or None if not found."""
-		return self._infosets.get(key)
+		Also accumulates the reach-weighted strategy into the average
+		strategy table.
+		"""
+		n = self._num_actions[row]
+		strategy = np.maximum(self._regrets[row, :n], 0.0)
+		total = strategy.sum()
+		if total > 0:
+			strategy /= total
+		else:
+			strategy.fill(1.0 / n)
+
+		self._strategy_sum[row, :n] += reach * strategy
+		return strategy
+
+	def update_regrets(
+		self,
+		row: int,
+		action_utilities: np.ndarray,
+		node_utility: float,
+		counterfactual_reach: float
+	) -> None:
+		"""
+		Accumulate counterfactual regrets in place, with the CFR+ floor.
+		"""
+		n = self._num_actions[row]
+		regrets = self._regrets[row, :n]
+		regrets += counterfactual_reach * (action_utilities - node_utility)
+		np.maximum(regrets, 0.0, out=regrets)
+
+	def get_average_strategy(self, row: int) -> np.ndarray:
+		"""Average strategy for a row (converges to equilibrium)."""
+		n = self._num_actions[row]
+		strategy_sum = self._strategy_sum[row, :n]
+		total = strategy_sum.sum()
+		if total > 0:
+			return strategy_sum / total
+		return _uniform(int(n))
 
 	def __len__(self) -> int:
-		return len(self._infosets)
+		return len(self._row_index)
 
-	def __contains__(self, key: str) -> bool:
-		return key in self._infosets
+	def __contains__(self, key: Hashable) -> bool:
+		return key in self._row_index
 
 	def __iter__(self):
-		return iter(self._infosets.items())
+		return iter(self.items())
 
 	def keys(self):
 		"""Return all information set keys."""
-		return self._infosets.keys()
-
-	def values(self):
-		"""Return all information sets."""
-		return self._infosets.values()
+		return self._row_index.keys()
 
 	def items(self):
-		"""Return all (key, infoset) pairs."""
-		return self._infosets.items()
+		"""Yield (key, average strategy) pairs."""
+		for key, row in self._row_index.items():
+			yield key, self.get_average_strategy(row)
 
-	def get_strategy(self, key: str) -> Optional[np.ndarray]:
+	def get_strategy(self, key: Hashable) -> Optional[np.ndarray]:
 		"""Get average strategy for an information set."""
-		infoset = self.get(key)
-		if infoset is None:
+		row = self._row_index.get(key)
+		if row is None:
 			return None
-		return infoset.get_average_strategy()
+		return self.get_average_strategy(row)
+
+	def save(self, prefix: str) -> None:
+		"""
+		Save tables under the given path prefix.
+
+		The arrays go to plain .npy files so they can be memory-mapped
+		back in; the key-to-row dict is pickled alongside.
+		"""
+		size = len(self._row_index)
+		np.save(f'{prefix}.regrets.npy', self._regrets[:size])
+		np.save(f'{prefix}.strategy_sum.npy', self._strategy_sum[:size])
+		np.save(f'{prefix}.num_actions.npy', self._num_actions[:size])
+		with open(f'{prefix}.keys.pkl', 'wb') as f:
+			pickle.dump(self._row_index, f)
+
+	def load(self, prefix: str, mmap: bool = True) -> None:
+		"""
+		Load previously saved tables for a warm start.
+
+		With mmap=True the arrays are memory-mapped read-write, so
+		startup pays demand page faults instead of a full file read and
+		multiple workers share physical pages.
+		"""
+		mode = 'r+' if mmap else None
+		self._regrets = np.load(f'{prefix}.regrets.npy', mmap_mode=mode)
+		self._strategy_sum = np.load(
+			f'{prefix}.strategy_sum.npy', mmap_mode=mode
+		)
+		self._num_actions = np.load(
+			f'{prefix}.num_actions.npy', mmap_mode=mode
+		)
+		with open(f'{prefix}.keys.pkl', 'rb') as f:
+			self._row_index = pickle.load(f)
 
 	def total_regret(self) -> float:
 		"""Compute total regret across all information sets."""
-		total = 0.0
-		for infoset in self._infosets.values():
-			total += np.sum(np.maximum(0, infoset.cumulative_regrets))
-		return total
+		used = self._regrets[:len(self._row_index)]
+		return float(np.maximum(used, 0.0).sum(dtype=np.float64))
 
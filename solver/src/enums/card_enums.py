@@ -4,100 +4,129 @@ Card enums: Rank and Suit.
 These match the Kotlin CardEnums.kt definitions for cross-language consistency.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class Rank(Enum):
+class Rank(IntEnum):
 	"""
 	Playing card ranks from lowest (TWO=2) to highest (ACE=14).
-	Numeric value used for hand evaluation and comparisons.
+	IntEnum so hand evaluation compares and reads values as plain ints
+	with no property indirection.
 	"""
-	TWO = (2, '2')
-	THREE = (3, '3')
-	FOUR = (4, '4')
-	FIVE = (5, '5')
-	SIX = (6, '6')
-	SEVEN = (7, '7')
-	EIGHT = (8, '8')
-	NINE = (9, '9')
-	TEN = (10, 'T')
-	JACK = (11, 'J')
-	QUEEN = (12, 'Q')
-	KING = (13, 'K')
-	ACE = (14, 'A')
-
-	def __init__(self, value: int, symbol: str):
-		self._value = value
-		self._symbol = symbol
-
-	@property
-	def value(self) -> int:
-		return self._value
+	TWO = 2
+	THREE = 3
+	FOUR = 4
+	FIVE = 5
+	SIX = 6
+	SEVEN = 7
+	EIGHT = 8
+	NINE = 9
+	TEN = 10
+	JACK = 11
+	QUEEN = 12
+	KING = 13
+	ACE = 14
 
 	@property
 	def symbol(self) -> str:
-		return self._symbol
+		return _RANK_SYMBOLS[self]
 
 	@classmethod
 	def from_symbol(cls, symbol: str) -> 'Rank':
 		"""Creates Rank from symbol string (e.g., 'A', 'T', '2')."""
-		symbol_upper = symbol.upper()
-		for rank in cls:
-			if rank.symbol == symbol_upper:
-				return rank
-		raise ValueError(f'Invalid rank symbol: {symbol}')
+		rank = _RANK_BY_SYMBOL.get(symbol.upper())
+		if rank is None:
+			raise ValueError(f'Invalid rank symbol: {symbol}')
+		return rank
 
 	@classmethod
 	def from_value(cls, value: int) -> 'Rank':
 		"""Creates Rank from numeric value (2-14)."""
-		for rank in cls:
-			if rank.value == value:
-				return rank
-		raise ValueError(f'Invalid rank value: {value}')
-
-
-class Suit(Enum):
+		rank = cls._value2member_map_.get(value)
+		if rank is None:
+			raise ValueError(f'Invalid rank value: {value}')
+		return rank
+
+
+# Symbol tables built once at import; lookups are O(1) dict hits
+# instead of linear scans over the enum
+_RANK_SYMBOLS: dict[Rank, str] = {
+	Rank.TWO: '2',
+	Rank.THREE: '3',
+	Rank.FOUR: '4',
+	Rank.FIVE: '5',
+	Rank.SIX: '6',
+	Rank.SEVEN: '7',
+	Rank.EIGHT: '8',
+	Rank.NINE: '9',
+	Rank.TEN: 'T',
+	Rank.JACK: 'J',
+	Rank.QUEEN: 'Q',
+	Rank.KING: 'K',
+	Rank.ACE: 'A',
+}
+_RANK_BY_SYMBOL: dict[str, Rank] = {
+	symbol: rank for rank, symbol in _RANK_SYMBOLS.items()
+}
+
+
+class Suit(IntEnum):
 	"""
 	Playing card suits.
-	Suits have equal value in standard poker (no suit ranking).
+	Suits have equal value in standard poker (no suit ranking); the
+	int values are just stable indices so Card hashes and comparisons
+	stay on the plain-int fast path (symbols live in the tables below).
 	"""
-	SPADES = ('s', 'spades')
-	HEARTS = ('h', 'hearts')
-	DIAMONDS = ('d', 'diamonds')
-	CLUBS = ('c', 'clubs')
-
-	def __init__(self, symbol: str, display_name: str):
-		self._symbol = symbol
-		self._display_name = display_name
+	SPADES = 0
+	HEARTS = 1
+	DIAMONDS = 2
+	CLUBS = 3
 
 	@property
 	def symbol(self) -> str:
-		return self._symbol
+		return _SUIT_SYMBOLS[self]
 
 	@property
 	def display_name(self) -> str:
-		return self._display_name
+		return _SUIT_NAMES[self]
 
 	@classmethod
 	def from_symbol(cls, symbol: str) -> 'Suit':
 		"""Creates Suit from single character symbol (s, h, d, c)."""
-		symbol_lower = symbol.lower()
-		for suit in cls:
-			if suit.symbol == symbol_lower:
-				return suit
-		raise ValueError(
-			f'Invalid suit symbol: {symbol}. Expected: s, h, d, or c'
-		)
+		suit = _SUIT_BY_SYMBOL.get(symbol.lower())
+		if suit is None:
+			raise ValueError(
+				f'Invalid suit symbol: {symbol}. Expected: s, h, d, or c'
+			)
+		return suit
 
 	@classmethod
 	def from_display_name(cls, name: str) -> 'Suit':
 		"""Creates Suit from display name (spades, hearts, diamonds, clubs)."""
-		name_lower = name.lower()
-		for suit in cls:
-			if suit.display_name == name_lower:
-				return suit
-		raise ValueError(
-			f'Invalid suit name: {name}. '
-			'Expected: spades, hearts, diamonds, or clubs'
-		)
-
+		suit = _SUIT_BY_NAME.get(name.lower())
+		if suit is None:
+			raise ValueError(
+				f'Invalid suit name: {name}. '
+				'Expected: spades, hearts, diamonds, or clubs'
+			)
+		return suit
+
+
+_SUIT_SYMBOLS: dict[Suit, str] = {
+	Suit.SPADES: 's',
+	Suit.HEARTS: 'h',
+	Suit.DIAMONDS: 'd',
+	Suit.CLUBS: 'c',
+}
+_SUIT_BY_SYMBOL: dict[str, Suit] = {
+	symbol: suit for suit, symbol in _SUIT_SYMBOLS.items()
+}
+_SUIT_NAMES: dict[Suit, str] = {
+	Suit.SPADES: 'spades',
+	Suit.HEARTS: 'hearts',
+	Suit.DIAMONDS: 'diamonds',
+	Suit.CLUBS: 'clubs',
+}
+_SUIT_BY_NAME: dict[str, Suit] = {
+	name: suit for suit, name in _SUIT_NAMES.items()
+}
@@ -0,0 +1,112 @@
+"""
+Numba-compiled kernel for scalar hand scoring.
+
+Importing this module requires numba (optional, see requirements.txt);
+HandEvaluator.evaluate_score falls back to its pure-Python
+implementation when the import fails. The kernel runs the same
+bitmask classification over the Cactus Kev card codes as the Python
+version, but as compiled integer loops with no interpreter dispatch.
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def score_codes(codes, top5, straight):
+	"""
+	Comparable hand score for 5-7 Cactus Kev card codes.
+
+	Mirrors HandEvaluator.evaluate_score exactly; scores are on the
+	evaluate_batch scale ((category << 20) | tiebreak).
+	"""
+	rank_bits = 0
+	counts = [0] * 13
+	# Indexed by the suit nibble (8/4/2/1); other slots stay zero
+	suit_bits = [0] * 16
+
+	for i in range(codes.shape[0]):
+		code = codes[i]
+		rank_index = (code >> 8) & 0xF
+		bit = 1 << rank_index
+		rank_bits |= bit
+		counts[rank_index] += 1
+		suit_bits[(code >> 12) & 0xF] |= bit
+
+	flush_bits = 0
+	for nibble in (8, 4, 2, 1):
+		bits = suit_bits[nibble]
+		popcount = 0
+		while bits:
+			bits &= bits - 1
+			popcount += 1
+		if popcount >= 5:
+			flush_bits = suit_bits[nibble]
+			break
+
+	if flush_bits:
+		sf_high = straight[flush_bits]
+		if sf_high:
+			return (8 << 20) | sf_high
+
+	quad_rank = 0
+	trip_rank = 0
+	paired_bits = 0
+	exact_pair_bits = 0
+	num_pairs = 0
+	for rank_index in range(13):
+		count = counts[rank_index]
+		if count < 2:
+			continue
+		paired_bits |= 1 << rank_index
+		if count == 4:
+			quad_rank = rank_index + 2
+		elif count == 3:
+			trip_rank = rank_index + 2
+		else:
+			exact_pair_bits |= 1 << rank_index
+			num_pairs += 1
+
+	if quad_rank:
+		quad_bit = 1 << (quad_rank - 2)
+		return (7 << 20) | (quad_rank << 4) | (
+			top5[rank_bits & ~quad_bit] >> 16
+		)
+
+	if trip_rank:
+		trip_bit = 1 << (trip_rank - 2)
+		fh_pair_bits = paired_bits & ~trip_bit
+		if fh_pair_bits:
+			return (6 << 20) | (trip_rank << 4) | (
+				top5[fh_pair_bits] >> 16
+			)
+
+	if flush_bits:
+		return (5 << 20) | top5[flush_bits]
+
+	straight_high = straight[rank_bits]
+	if straight_high:
+		return (4 << 20) | straight_high
+
+	if trip_rank:
+		trip_bit = 1 << (trip_rank - 2)
+		return (3 << 20) | (trip_rank << 8) | (
+			top5[rank_bits & ~trip_bit] >> 12
+		)
+
+	if num_pairs >= 2:
+		two_pair_top = top5[exact_pair_bits] >> 12
+		high_pair = two_pair_top >> 4
+		low_pair = two_pair_top & 0xF
+		used = (1 << (high_pair - 2)) | (1 << (low_pair - 2))
+		return (2 << 20) | (two_pair_top << 4) | (
+			top5[rank_bits & ~used] >> 16
+		)
+
+	if num_pairs == 1:
+		pair_rank = top5[exact_pair_bits] >> 16
+		pair_bit = 1 << (pair_rank - 2)
+		return (1 << 20) | (pair_rank << 12) | (
+			top5[rank_bits & ~pair_bit] >> 8
+		)
+
+	return top5[rank_bits]
@@ -2,55 +2,89 @@
 Poker actions for game state representation.
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from enum import IntEnum
 
 
-class ActionType(Enum):
-	"""Types of actions a player can take."""
-	FOLD = 'fold'
-	CHECK = 'check'
-	CALL = 'call'
-	BET = 'bet'
-	RAISE = 'raise'
-	ALL_IN = 'all_in'
+class ActionType(IntEnum):
+	"""
+	Types of actions a player can take.
+
+	IntEnum so type checks in the traversal hot path are native int
+	comparisons and the category tests below are single mask tests.
+	"""
+	FOLD = 0
+	CHECK = 1
+	CALL = 2
+	BET = 3
+	RAISE = 4
+	ALL_IN = 5
+
+
+# Display names and history encodings indexed by ActionType value
+_TYPE_NAMES = ('fold', 'check', 'call', 'bet', 'raise', 'all_in')
+_ENCODE_CHARS = ('f', 'x', 'c', 'b', 'r', 'a')
+
+# Category bitmasks: membership is one AND instead of a tuple scan
+_AGGRESSIVE_MASK = (
+	(1 << ActionType.BET) | (1 << ActionType.RAISE) | (1 << ActionType.ALL_IN)
+)
+_PASSIVE_MASK = (1 << ActionType.CHECK) | (1 << ActionType.CALL)
 
 
-@dataclass(frozen=True)
 class Action:
 	"""
 	Represents a player action in poker.
 
+	Treated as immutable (never mutate a constructed Action): the
+	amount-less actions are interned singletons, and get_legal_actions
+	builds several Actions per node, so the class uses __slots__ with
+	hand-written equality/hashing instead of the dataclass machinery.
+
 	Attributes:
 		type: The type of action (fold, check, call, bet, raise, all_in)
 		amount: The bet/raise amount (0 for fold/check/call)
 	"""
-	type: ActionType
-	amount: int = 0
+
+	__slots__ = ('type', 'amount', '_encoded')
+
+	def __init__(self, type: ActionType, amount: int = 0):
+		self.type = type
+		self.amount = amount
+		self._encoded = None
+
+	def __eq__(self, other: object) -> bool:
+		return (
+			isinstance(other, Action)
+			and self.type is other.type
+			and self.amount == other.amount
+		)
+
+	def __hash__(self) -> int:
+		return hash((self.type, self.amount))
 
 	def __str__(self) -> str:
-		if self.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
-			return f'{self.type.value}({self.amount})'
-		return self.type.value
+		name = _TYPE_NAMES[self.type]
+		if _AGGRESSIVE_MASK & (1 << self.type):
+			return f'{name}({self.amount})'
+		return name
 
 	def __repr__(self) -> str:
-		return f'Action({self.type.value}, {self.amount})'
+		return f'Action({_TYPE_NAMES[self.type]}, {self.amount})'
 
 	@classmethod
 	def fold(cls) -> 'Action':
 		"""Create a fold action."""
-		return cls(ActionType.FOLD)
+		return _FOLD
 
 	@classmethod
 	def check(cls) -> 'Action':
 		"""Create a check action."""
-		return cls(ActionType.CHECK)
+		return _CHECK
 
 	@classmethod
 	def call(cls) -> 'Action':
 		"""Create a call action."""
-		return cls(ActionType.CALL)
+		return _CALL
 
 	@classmethod
 	def bet(cls, amount: int) -> 'Action':
@@ -69,28 +103,36 @@ class Action:
 
 	def is_aggressive(self) -> bool:
 		"""Returns True if this is a bet, raise, or all-in."""
-		return self.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN)
+		return bool(_AGGRESSIVE_MASK & (1 << self.type))
 
 	def is_passive(self) -> bool:
 		"""Returns True if this is a check or call."""
-		return self.type in (ActionType.CHECK, ActionType.CALL)
+		return bool(_PASSIVE_MASK & (1 << self.type))
 
 	def encode(self) -> str:
 		"""
 		Encode action to a short string for history representation.
 		Used in information set keys.
+
+		Memoized per instance: the abstraction layer reuses Action
+		objects across nodes, so the amount formatting runs once per
+		distinct action instead of once per history append.
 		"""
-		if self.type == ActionType.FOLD:
-			return 'f'
-		elif self.type == ActionType.CHECK:
-			return 'x'
-		elif self.type == ActionType.CALL:
-			return 'c'
-		elif self.type == ActionType.BET:
-			return f'b{self.amount}'
-		elif self.type == ActionType.RAISE:
-			return f'r{self.amount}'
-		elif self.type == ActionType.ALL_IN:
-			return 'a'
-		return '?'
+		encoded = self._encoded
+		if encoded is None:
+			action_type = self.type
+			if action_type == ActionType.BET:
+				encoded = f'b{self.amount}'
+			elif action_type == ActionType.RAISE:
+				encoded = f'r{self.amount}'
+			else:
+				encoded = _ENCODE_CHARS[action_type]
+			self._encoded = encoded
+		return encoded
+
+
+# Interned amount-less actions returned by the factory methods
+_FOLD = Action(ActionType.FOLD)
+_CHECK = Action(ActionType.CHECK)
+_CALL = Action(ActionType.CALL)
 
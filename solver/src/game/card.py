@@ -6,20 +6,57 @@ from dataclasses import dataclass
 
 from ..enums import Rank, Suit
 
+# Cactus Kev card layout (one u32 per card):
+#   xxxAKQJT 98765432 SHDCrrrr xxpppppp
+# bit 16+r: one-hot rank flag, SHDC: one-hot suit nibble,
+# rrrr: rank index 0-12, pppppp: rank prime for multiplicative hashing
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = {
+	Suit.SPADES: 0x8000,
+	Suit.HEARTS: 0x4000,
+	Suit.DIAMONDS: 0x2000,
+	Suit.CLUBS: 0x1000,
+}
+
 
 @dataclass(frozen=True)
 class Card:
 	"""
 	Represents a playing card with type-safe rank and suit.
 	Immutable to allow use in sets and as dict keys.
+
+	Each card also carries a precomputed Cactus Kev integer code
+	(``card.code``) so bitwise hand evaluation and set logic can work
+	on native ints without touching the enum fields.
 	"""
 	rank: Rank
 	suit: Suit
 
+	def __post_init__(self):
+		rank_index = self.rank - 2
+		object.__setattr__(self, 'code', (
+			(1 << (rank_index + 16))
+			| _SUIT_BITS[self.suit]
+			| (rank_index << 8)
+			| _RANK_PRIMES[rank_index]
+		))
+		# Single-bit mask over a 52-bit deck (bit = rank_index*4 + suit),
+		# so card sets can be plain ints combined with |/& instead of
+		# hashing dataclasses into set[Card]
+		object.__setattr__(
+			self, 'mask', 1 << (rank_index * 4 + self.suit)
+		)
+		# Notation is computed once here so the property and __str__ are
+		# plain attribute reads; with the interned 52-card table this
+		# means every notation string in the process is shared
+		object.__setattr__(
+			self, '_notation', f'{self.rank.symbol}{self.suit.symbol}'
+		)
+
 	@property
 	def notation(self) -> str:
 		"""Short notation for the card (e.g., 'As' for Ace of Spades)."""
-		return f'{self.rank.symbol}{self.suit.symbol}'
+		return self._notation
 
 	def __str__(self) -> str:
 		return self.notation
@@ -32,12 +69,34 @@ class Card:
 		"""
 		Creates card from notation string (e.g., 'As', 'Th').
 		Used internally for convenience, not exposed in API.
+
+		Returns the interned instance for the notation, so parsing the
+		same card repeatedly allocates nothing.
 		"""
 		if len(notation) != 2:
 			raise ValueError(f'Card notation must be 2 characters: {notation}')
-		rank = Rank.from_symbol(notation[0])
-		suit = Suit.from_symbol(notation[1])
-		return cls(rank=rank, suit=suit)
+
+		card = _CARD_CACHE.get(notation[0].upper() + notation[1].lower())
+		if card is None:
+			# Re-run symbol parsing for the specific error message
+			rank = Rank.from_symbol(notation[0])
+			suit = Suit.from_symbol(notation[1])
+			return cls(rank=rank, suit=suit)
+		return card
+
+
+# Interned table of all 52 cards, keyed by notation
+_CARD_CACHE: dict[str, Card] = {
+	f'{rank.symbol}{suit.symbol}': Card(rank=rank, suit=suit)
+	for suit in Suit
+	for rank in Rank
+}
+
+# The same interned cards keyed by Cactus Kev code, for callers that
+# round-trip cards through their integer encoding
+_CARD_BY_CODE: dict[int, Card] = {
+	card.code: card for card in _CARD_CACHE.values()
+}
 
 
 def cards_from_string(s: str) -> list[Card]:
@@ -8,6 +8,13 @@ from typing import Optional
 from .card import Card
 from ..enums import Rank, Suit
 
+# Full-deck template built once at import: every Deck copies or filters
+# this instead of reconstructing 52 Card instances per instantiation
+# (rollouts build a fresh Deck at each terminal node)
+_FULL_DECK: tuple[Card, ...] = tuple(
+	Card(rank=rank, suit=suit) for suit in Suit for rank in Rank
+)
+
 
 class Deck:
 	"""
@@ -22,14 +29,17 @@ class Deck:
 		Args:
 			exclude: Cards to exclude from the deck (for partial deals)
 		"""
-		self._cards: list[Card] = []
-		exclude_set = set(exclude) if exclude else set()
-
-		for suit in Suit:
-			for rank in Rank:
-				card = Card(rank=rank, suit=suit)
-				if card not in exclude_set:
-					self._cards.append(card)
+		if exclude:
+			# Card sets are 52-bit ints: one OR per excluded card, one
+			# AND per membership test, no dataclass hashing
+			excl_mask = 0
+			for card in exclude:
+				excl_mask |= card.mask
+			self._cards: list[Card] = [
+				c for c in _FULL_DECK if not excl_mask & c.mask
+			]
+		else:
+			self._cards = list(_FULL_DECK)
 
 	def __len__(self) -> int:
 		return len(self._cards)
@@ -60,8 +70,10 @@ class Deck:
 				f'Cannot deal {n} cards, only {len(self._cards)} remain'
 			)
 
-		dealt = self._cards[:n]
-		self._cards = self._cards[n:]
+		# Deal from the end: shuffle already randomized the order, and
+		# trimming the tail avoids reallocating the whole list per deal
+		dealt = self._cards[-n:]
+		del self._cards[-n:]
 		return dealt
 
 	def deal_one(self) -> Card:
@@ -78,13 +90,23 @@ class Deck:
 		Returns:
 			Self for chaining
 		"""
-		card_set = set(cards)
-		self._cards = [c for c in self._cards if c not in card_set]
+		if len(cards) <= 4:
+			# Few removals: in-place list.remove beats rebuilding
+			for card in cards:
+				if card in self._cards:
+					self._cards.remove(card)
+		else:
+			remove_mask = 0
+			for card in cards:
+				remove_mask |= card.mask
+			self._cards = [
+				c for c in self._cards if not remove_mask & c.mask
+			]
 		return self
 
 	def peek(self, n: int = 1) -> list[Card]:
-		"""Look at the top n cards without removing them."""
-		return self._cards[:n]
+		"""Look at the top n cards (the next dealt) without removing them."""
+		return self._cards[-n:]
 
 	@property
 	def remaining(self) -> list[Card]:
@@ -2,15 +2,20 @@
 Game state representation for Heads-Up No-Limit Texas Hold'em.
 """
 
-from dataclasses import dataclass, field
+import random
+from dataclasses import dataclass, field, replace
+from itertools import chain
 from enum import Enum
 from typing import Optional
-import copy
+
+import numpy as np
 
 from .card import Card
-from .deck import Deck
+from .deck import _FULL_DECK
 from .action import Action, ActionType
-from .hand_evaluator import HandEvaluator
+from .hand_evaluator import HandEvaluator, card_index
+
+_ALL_CARD_INDICES = np.arange(52, dtype=np.int64)
 
 
 class Street(Enum):
@@ -22,9 +27,23 @@ class Street(Enum):
 
 	def next(self) -> Optional['Street']:
 		"""Returns the next street, or None if already at river."""
-		if self == Street.RIVER:
-			return None
-		return Street(self.value + 1)
+		return _NEXT_STREET[self]
+
+
+# Street transition and board-size tables built once at import, so the
+# hot paths do one dict hit instead of enum construction or building a
+# throwaway mapping per call
+_NEXT_STREET: dict[Street, Optional[Street]] = {
+	Street.PREFLOP: Street.FLOP,
+	Street.FLOP: Street.TURN,
+	Street.TURN: Street.RIVER,
+	Street.RIVER: None,
+}
+_TARGET_BOARD_CARDS: dict[Street, int] = {
+	Street.FLOP: 3,
+	Street.TURN: 4,
+	Street.RIVER: 5,
+}
 
 
 @dataclass
@@ -52,8 +71,9 @@ class GameState:
 	# Current betting street
 	street: Street
 
-	# History of actions taken this hand
-	action_history: list[Action] = field(default_factory=list)
+	# History of actions taken this hand (tuple: extended by one entry
+	# per node, never mutated, so successor states share the storage)
+	action_history: tuple[Action, ...] = ()
 
 	# Amount each player has bet in current betting round
 	bets_this_round: list[int] = field(default_factory=lambda: [0, 0])
@@ -70,6 +90,9 @@ class GameState:
 	# Whether this round has seen a bet/raise
 	facing_bet: bool = False
 
+	# Encoded action history, maintained incrementally by apply_action
+	_history_encoded: str = ''
+
 	@classmethod
 	def new_hand(
 		cls,
@@ -101,7 +124,7 @@ class GameState:
 			stacks=[stacks[0] - small_blind, stacks[1] - big_blind],
 			current_player=0,  # SB acts first preflop
 			street=Street.PREFLOP,
-			action_history=[],
+			action_history=(),
 			bets_this_round=[small_blind, big_blind],
 			is_terminal=False,
 			winner=-1,
@@ -109,57 +132,49 @@ class GameState:
 			facing_bet=True  # SB is facing BB's forced bet
 		)
 
-	def get_legal_actions(self) -> list[Action]:
+	def get_legal_actions(self) -> tuple[Action, ...]:
 		"""
 		Returns all legal actions for the current player.
+
+		Split into a facing-bet branch and a checked-to branch so each
+		path runs only its own comparisons; the amount-less actions are
+		the interned singletons, so typical calls allocate just the
+		result tuple and any sized bet/raise/all-in.
 		"""
 		if self.is_terminal:
-			return []
+			return ()
 
-		actions = []
 		player = self.current_player
 		my_stack = self.stacks[player]
 		my_bet = self.bets_this_round[player]
 		opp_bet = self.bets_this_round[1 - player]
 		to_call = opp_bet - my_bet
+		min_raise = self._get_min_raise()
 
-		# Fold is always legal if facing a bet
 		if to_call > 0:
-			actions.append(Action.fold())
-
-		# Check is legal if not facing a bet
-		if to_call == 0:
-			actions.append(Action.check())
-
-		# Call is legal if facing a bet and have chips
-		if to_call > 0 and my_stack > 0:
-			call_amount = min(to_call, my_stack)
-			if call_amount < my_stack:
-				actions.append(Action.call())
-			else:
-				# Calling puts us all-in
-				actions.append(Action.all_in(call_amount))
-
-		# Bet/Raise if we have enough chips
-		min_raise = self._get_min_raise()
-		if my_stack > to_call:
-			if to_call == 0:
-				# Bet (no current bet to raise)
-				if my_stack >= min_raise:
-					actions.append(Action.bet(min_raise))
-				# Can always go all-in
-				if my_stack > min_raise:
-					actions.append(Action.all_in(my_stack))
-			else:
-				# Raise (there's a bet to raise)
+			# Facing a bet: fold, then call (or all-in call), then raise
+			actions = [Action.fold()]
+			if my_stack > 0:
+				call_amount = min(to_call, my_stack)
+				if call_amount < my_stack:
+					actions.append(Action.call())
+				else:
+					# Calling puts us all-in
+					actions.append(Action.all_in(call_amount))
+			if my_stack > to_call:
 				raise_total = opp_bet + min_raise
 				if my_stack >= raise_total - my_bet:
 					actions.append(Action.raise_to(raise_total))
-				# Can always go all-in if we have more than call amount
-				if my_stack > to_call:
-					actions.append(Action.all_in(my_stack))
+				actions.append(Action.all_in(my_stack))
+			return tuple(actions)
 
-		return actions
+		# Checked to: check, then bet or shove
+		actions = [Action.check()]
+		if my_stack >= min_raise:
+			actions.append(Action.bet(min_raise))
+		if my_stack > min_raise:
+			actions.append(Action.all_in(my_stack))
+		return tuple(actions)
 
 	def _get_min_raise(self) -> int:
 		"""Returns minimum raise/bet size."""
@@ -172,9 +187,32 @@ class GameState:
 
 		Returns a new GameState object (doesn't mutate self).
 		"""
-		# Create a copy of the current state
-		new_state = copy.deepcopy(self)
-		new_state.action_history = self.action_history + [action]
+		# Shallow reconstruction instead of deepcopy: only the lists
+		# mutated below get fresh copies. Cards are immutable, so
+		# hole_cards is shared outright and community_cards is only
+		# ever rebound (never mutated in place) by the street helpers.
+		# Fold and check never touch chips, so those nodes share the
+		# parent's stacks/bets lists outright (states are never mutated
+		# after construction; _advance_street only rebinds the fields).
+		action_type = action.type
+		if action_type is ActionType.FOLD or action_type is ActionType.CHECK:
+			new_state = replace(
+				self,
+				action_history=self.action_history + (action,)
+			)
+		else:
+			new_state = replace(
+				self,
+				stacks=self.stacks.copy(),
+				bets_this_round=self.bets_this_round.copy(),
+				action_history=self.action_history + (action,)
+			)
+		if self._history_encoded:
+			new_state._history_encoded = (
+				self._history_encoded + '|' + action.encode()
+			)
+		else:
+			new_state._history_encoded = action.encode()
 
 		player = self.current_player
 		opponent = 1 - player
@@ -182,54 +220,54 @@ class GameState:
 		opp_bet = self.bets_this_round[opponent]
 		to_call = opp_bet - my_bet
 
-		if action.type == ActionType.FOLD:
-			new_state.is_terminal = True
-			new_state.winner = opponent
-			return new_state
-
-		elif action.type == ActionType.CHECK:
-			# Check if round is complete
-			if self._is_round_complete_after_check():
+		match action.type:
+			case ActionType.FOLD:
+				new_state.is_terminal = True
+				new_state.winner = opponent
+				return new_state
+
+			case ActionType.CHECK:
+				# Check if round is complete
+				if self._is_round_complete_after_check():
+					new_state._advance_street()
+				else:
+					new_state.current_player = opponent
+
+			case ActionType.CALL:
+				call_amount = min(to_call, self.stacks[player])
+				new_state.stacks[player] -= call_amount
+				new_state.pot += call_amount
+				new_state.bets_this_round[player] += call_amount
+
+				# After a call, round is complete
 				new_state._advance_street()
-			else:
-				new_state.current_player = opponent
 
-		elif action.type == ActionType.CALL:
-			call_amount = min(to_call, self.stacks[player])
-			new_state.stacks[player] -= call_amount
-			new_state.pot += call_amount
-			new_state.bets_this_round[player] += call_amount
-
-			# After a call, round is complete
-			new_state._advance_street()
-
-		elif action.type in (ActionType.BET, ActionType.RAISE):
-			# Calculate amount going into pot
-			if action.type == ActionType.BET:
-				amount_to_pot = action.amount
-			else:
-				# Raise to X means total bet is X
-				amount_to_pot = action.amount - my_bet
-
-			new_state.stacks[player] -= amount_to_pot
-			new_state.pot += amount_to_pot
-			new_state.bets_this_round[player] += amount_to_pot
-			new_state.current_player = opponent
-			new_state.facing_bet = True
-
-		elif action.type == ActionType.ALL_IN:
-			amount = action.amount
-			new_state.stacks[player] -= amount
-			new_state.pot += amount
-			new_state.bets_this_round[player] += amount
-
-			# Check if opponent needs to act
-			if new_state.bets_this_round[player] > opp_bet:
+			case ActionType.BET | ActionType.RAISE:
+				# Bet puts in its amount; raise to X means total bet is X
+				if action.type == ActionType.BET:
+					amount_to_pot = action.amount
+				else:
+					amount_to_pot = action.amount - my_bet
+
+				new_state.stacks[player] -= amount_to_pot
+				new_state.pot += amount_to_pot
+				new_state.bets_this_round[player] += amount_to_pot
 				new_state.current_player = opponent
 				new_state.facing_bet = True
-			else:
-				# All-in for less than call amount, round complete
-				new_state._advance_street()
+
+			case ActionType.ALL_IN:
+				amount = action.amount
+				new_state.stacks[player] -= amount
+				new_state.pot += amount
+				new_state.bets_this_round[player] += amount
+
+				# Check if opponent needs to act
+				if new_state.bets_this_round[player] > opp_bet:
+					new_state.current_player = opponent
+					new_state.facing_bet = True
+				else:
+					# All-in for less than call amount, round complete
+					new_state._advance_street()
 
 		return new_state
 
@@ -264,37 +302,43 @@ class GameState:
 			# Deal community cards for the new street
 			self._deal_street_cards(next_street)
 
+	def _sample_live_cards(self, n: int) -> list[Card]:
+		"""
+		Sample n cards uniformly from those not yet seen this hand.
+
+		Filters the interned full-deck template against a 52-bit
+		dead-card mask and random.sample()s the result, instead of
+		materializing and Fisher-Yates-shuffling a whole Deck just to
+		pull a few cards at every street transition.
+		"""
+		dead_mask = 0
+		for card in self.hole_cards[0]:
+			dead_mask |= card.mask
+		for card in self.hole_cards[1]:
+			dead_mask |= card.mask
+		for card in self.community_cards:
+			dead_mask |= card.mask
+		live = [c for c in _FULL_DECK if not dead_mask & c.mask]
+		return random.sample(live, n)
+
 	def _deal_street_cards(self, street: 'Street') -> None:
 		"""Deal community cards for a street."""
-		from .deck import Deck
-
 		# Determine how many cards should be on board after this street
-		target_cards = {
-			Street.FLOP: 3,
-			Street.TURN: 4,
-			Street.RIVER: 5
-		}.get(street, 0)
+		target_cards = _TARGET_BOARD_CARDS.get(street, 0)
 
 		cards_needed = target_cards - len(self.community_cards)
 		if cards_needed > 0:
-			# Create deck excluding known cards
-			excluded = list(self.hole_cards[0]) + list(self.hole_cards[1])
-			excluded += self.community_cards
-			deck = Deck(exclude=excluded).shuffle()
-			self.community_cards = self.community_cards + deck.deal(cards_needed)
+			self.community_cards = (
+				self.community_cards + self._sample_live_cards(cards_needed)
+			)
 
 	def _run_out_board(self) -> None:
 		"""Run out remaining community cards and go to showdown."""
-		from .deck import Deck
-
-		# Deal remaining community cards
 		cards_needed = 5 - len(self.community_cards)
 		if cards_needed > 0:
-			# Create deck excluding known cards
-			excluded = list(self.hole_cards[0]) + list(self.hole_cards[1])
-			excluded += self.community_cards
-			deck = Deck(exclude=excluded).shuffle()
-			self.community_cards = self.community_cards + deck.deal(cards_needed)
+			self.community_cards = (
+				self.community_cards + self._sample_live_cards(cards_needed)
+			)
 
 		self._showdown()
 
@@ -302,20 +346,91 @@ class GameState:
 		"""Determine winner at showdown."""
 		self.is_terminal = True
 
-		hand0 = HandEvaluator.evaluate(
-			self.hole_cards[0], self.community_cards
+		# Score-only comparison: the integer fast path skips building
+		# HandResult objects for the 21 five-card combinations, and
+		# chaining hole and board avoids two 7-card list concatenations
+		# per terminal node
+		board = self.community_cards
+		score0 = HandEvaluator.evaluate_score(
+			chain(self.hole_cards[0], board)
 		)
-		hand1 = HandEvaluator.evaluate(
-			self.hole_cards[1], self.community_cards
+		score1 = HandEvaluator.evaluate_score(
+			chain(self.hole_cards[1], board)
 		)
 
-		if hand0.absolute_rank > hand1.absolute_rank:
+		if score0 > score1:
 			self.winner = 0
-		elif hand1.absolute_rank > hand0.absolute_rank:
+		elif score1 > score0:
 			self.winner = 1
 		else:
 			self.winner = 2  # Tie
 
+	def rollout_equity(self, n_samples: int = 1000) -> float:
+		"""
+		Estimate player 0's showdown equity over random board run-outs.
+
+		All run-outs are drawn in one numpy permutation of the live
+		cards and both hands are scored with the vectorized batch
+		evaluator, instead of building a Deck and evaluating hand by
+		hand per sample.
+
+		Args:
+			n_samples: Number of Monte Carlo run-outs
+
+		Returns:
+			Win probability for player 0 (ties count half)
+		"""
+		board = self.community_cards
+		cards_needed = 5 - len(board)
+
+		if cards_needed == 0:
+			score0 = HandEvaluator.evaluate_score(
+				chain(self.hole_cards[0], board)
+			)
+			score1 = HandEvaluator.evaluate_score(
+				chain(self.hole_cards[1], board)
+			)
+			if score0 != score1:
+				return 1.0 if score0 > score1 else 0.0
+			return 0.5
+
+		hole0_idx = np.array(
+			[card_index(c) for c in self.hole_cards[0]], dtype=np.int64
+		)
+		hole1_idx = np.array(
+			[card_index(c) for c in self.hole_cards[1]], dtype=np.int64
+		)
+		board_idx = np.array(
+			[card_index(c) for c in board], dtype=np.int64
+		)
+
+		dead_mask = 0
+		for idx in (*hole0_idx, *hole1_idx, *board_idx):
+			dead_mask |= 1 << int(idx)
+		available = _ALL_CARD_INDICES[
+			(dead_mask >> _ALL_CARD_INDICES) & 1 == 0
+		]
+
+		# One permutation per row; the first cards_needed columns are
+		# that row's run-out
+		rng = np.random.default_rng()
+		runouts = rng.permuted(
+			np.broadcast_to(available, (n_samples, available.size)),
+			axis=1
+		)[:, :cards_needed]
+
+		boards_idx = np.concatenate([
+			np.broadcast_to(board_idx, (n_samples, board_idx.size)),
+			runouts
+		], axis=1)
+
+		scores0 = HandEvaluator.evaluate_batch(hole0_idx, boards_idx)
+		scores1 = HandEvaluator.evaluate_batch(hole1_idx, boards_idx)
+
+		wins = int((scores0 > scores1).sum())
+		ties = int((scores0 == scores1).sum())
+		return (wins + ties * 0.5) / n_samples
+
 	def get_payoff(self, player: int) -> float:
 		"""
 		Returns payoff for specified player.
@@ -336,9 +451,35 @@ class GameState:
 			# Loser loses their contribution
 			return -self.pot / 2
 
+	def action_signature(self) -> int:
+		"""
+		Pack the fields that determine the legal/abstract action set
+		into a single int.
+
+		Street phase, both players' bets this round, the actor's stack,
+		pot, and big blind fully determine the action set; hole cards
+		play no part. 20-bit fields keep any realistic chip count
+		collision-free.
+		"""
+		player = self.current_player
+		return (
+			(1 if self.street == Street.PREFLOP else 0)
+			| (self.bets_this_round[player] << 1)
+			| (self.bets_this_round[1 - player] << 21)
+			| (self.stacks[player] << 41)
+			| (self.pot << 61)
+			| (self.big_blind << 81)
+		)
+
 	def encode_history(self) -> str:
-		"""Encode action history to string for information set key."""
-		return '|'.join(a.encode() for a in self.action_history)
+		"""
+		Encode action history to string for information set key.
+
+		The encoding is built up one action at a time in apply_action,
+		so this is a cached-field read rather than an O(depth) re-join
+		at every CFR node.
+		"""
+		return self._history_encoded
 
 	def __str__(self) -> str:
 		return (
@@ -8,18 +8,96 @@ Ported from Kotlin HandEvaluator.kt
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import combinations
-from typing import Optional
+from typing import Iterable, Optional
 
-from .card import Card
+import numpy as np
+
+from .card import Card, _CARD_BY_CODE
 from .hand_rankings import HandType, HandRankingConstants
 
+# Numba is optional (see requirements.txt); the pure-Python scalar
+# scorer is the fallback
+try:
+	from . import _eval_kernels as _kernels
+	_HAS_NUMBA = True
+except ImportError:
+	_HAS_NUMBA = False
+
+
+def _build_batch_tables() -> tuple[np.ndarray, np.ndarray]:
+	"""
+	Build lookup tables for the vectorized batch evaluator.
+
+	Rank sets are encoded as 13-bit masks (bit i = rank value i+2 present).
+	For each possible mask:
+	- TOP5 packs the five highest present ranks into 4-bit nibbles
+	  (highest rank in the most significant nibble, zero-padded)
+	- STRAIGHT holds the high card of the best straight, or 0
+	"""
+	top5 = np.zeros(1 << 13, dtype=np.int64)
+	straight = np.zeros(1 << 13, dtype=np.int64)
+
+	for mask in range(1 << 13):
+		packed = 0
+		count = 0
+		for bit in range(12, -1, -1):
+			if mask & (1 << bit) and count < 5:
+				packed = (packed << 4) | (bit + 2)
+				count += 1
+		top5[mask] = packed << (4 * (5 - count))
+
+		for high in range(14, 4, -1):
+			if high == 5:
+				# Wheel: A-2-3-4-5 (ace is bit 12)
+				need = (1 << 12) | 0b1111
+			else:
+				need = 0b11111 << (high - 6)
+			if mask & need == need:
+				straight[mask] = high
+				break
+
+	return top5, straight
+
+
+_TOP5_TABLE, _STRAIGHT_TABLE = _build_batch_tables()
+
+
+def card_index(card: Card) -> int:
+	"""
+	Integer encoding of a card for evaluate_batch:
+	(rank_value - 2) * 4 + suit index.
+
+	This is the contract of the batch evaluator's card arrays; callers
+	building index arrays should use this instead of re-deriving it.
+	"""
+	return (card.rank - 2) * 4 + card.suit
+
+# A-2-3-4-5 as a rank-value bitmask (bit i = rank value i present)
+_WHEEL_MASK = (1 << 14) | (1 << 5) | (1 << 4) | (1 << 3) | (1 << 2)
+
+# All ten straights as rank-value bitmasks: membership replaces the
+# popcount/span arithmetic with one hash probe
+_STRAIGHT_MASKS = frozenset(
+	0b11111 << low for low in range(2, 11)
+) | {_WHEEL_MASK}
+
+# Plain-list views of the tables for the scalar fast path (indexing a
+# Python list with a Python int avoids numpy scalar boxing)
+_TOP5_LIST = _TOP5_TABLE.tolist()
+_STRAIGHT_LIST = _STRAIGHT_TABLE.tolist()
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandResult:
 	"""
 	Result of hand evaluation with standardized ranking.
 
+	Frozen with slots: results are shared via the evaluation cache, so
+	instances must be immutable, and dropping the per-instance __dict__
+	halves their footprint.
+
 	Attributes:
 		absolute_rank: Ranking from 1-7462 (higher = better)
 		hand_type: The category of hand (pair, flush, etc.)
@@ -77,30 +155,381 @@ class HandEvaluator:
 				f'Must have 5-7 cards, got {len(all_cards)}'
 			)
 
-		# Generate all 5-card combinations and find best
-		best_result: Optional[HandResult] = None
-		for combo in combinations(all_cards, 5):
-			result = HandEvaluator._evaluate_five_cards(list(combo))
-			if best_result is None or result > best_result:
-				best_result = result
+		# Memoize on the order-independent card set: CFR revisits the
+		# same boards with many hole-card assignments, so repeat hands
+		# become one dict hit instead of a re-classification
+		return _evaluate_cached(
+			tuple(sorted(card.code for card in all_cards))
+		)
+
+	@staticmethod
+	def _classify_best_hand(all_cards: list[Card]) -> HandResult:
+		"""Classification pass behind evaluate(); see _evaluate_cached."""
+		# Classify the best five cards in one bitmask pass over the
+		# Cactus Kev codes (same scheme as evaluate_score), then build
+		# the HandResult once, instead of ranking all 21 combinations
+		# through _evaluate_five_cards
+		rank_bits = 0
+		counts = [0] * 13
+		suit_bits = {0x8000: 0, 0x4000: 0, 0x2000: 0, 0x1000: 0}
+
+		for card in all_cards:
+			code = card.code
+			rank_index = (code >> 8) & 0xF
+			bit = 1 << rank_index
+			rank_bits |= bit
+			counts[rank_index] += 1
+			suit_bits[code & 0xF000] |= bit
+
+		flush_bits = 0
+		for bits in suit_bits.values():
+			if bits.bit_count() >= 5:
+				flush_bits = bits
+				break
+
+		if flush_bits:
+			sf_high = _STRAIGHT_LIST[flush_bits]
+			if sf_high:
+				return _make_result(
+					HandType.STRAIGHT_FLUSH,
+					HandEvaluator._calculate_straight_flush_rank(sf_high),
+					'Royal Flush' if sf_high == 14
+					else f'Straight Flush, {_rank_to_name(sf_high)} high'
+				)
+
+		quad_rank = 0
+		trip_rank = 0
+		paired_bits = 0
+		exact_pair_bits = 0
+		num_pairs = 0
+		for rank_index in range(13):
+			count = counts[rank_index]
+			if count < 2:
+				continue
+			paired_bits |= 1 << rank_index
+			if count == 4:
+				quad_rank = rank_index + 2
+			elif count == 3:
+				trip_rank = rank_index + 2
+			else:
+				exact_pair_bits |= 1 << rank_index
+				num_pairs += 1
+
+		t5 = _TOP5_LIST
+
+		if quad_rank:
+			kicker = t5[rank_bits & ~(1 << (quad_rank - 2))] >> 16
+			return _make_result(
+				HandType.FOUR_OF_A_KIND,
+				HandEvaluator._calculate_four_of_kind_rank(quad_rank, kicker),
+				f'Four of a Kind, {_rank_to_name(quad_rank)}s'
+			)
+
+		if trip_rank:
+			fh_pair_bits = paired_bits & ~(1 << (trip_rank - 2))
+			if fh_pair_bits:
+				pair = t5[fh_pair_bits] >> 16
+				return _make_result(
+					HandType.FULL_HOUSE,
+					HandEvaluator._calculate_full_house_rank(trip_rank, pair),
+					f'Full House, {_rank_to_name(trip_rank)}s '
+					f'full of {_rank_to_name(pair)}s'
+				)
+
+		if flush_bits:
+			values = _unpack_nibbles(t5[flush_bits], 5)
+			return _make_result(
+				HandType.FLUSH,
+				HandEvaluator._calculate_flush_rank(values),
+				f'Flush, {_rank_to_name(values[0])} high'
+			)
+
+		straight_high = _STRAIGHT_LIST[rank_bits]
+		if straight_high:
+			return _make_result(
+				HandType.STRAIGHT,
+				HandEvaluator._calculate_straight_rank(straight_high),
+				f'Straight, {_rank_to_name(straight_high)} high'
+			)
+
+		if trip_rank:
+			kickers = _unpack_nibbles(
+				t5[rank_bits & ~(1 << (trip_rank - 2))], 2
+			)
+			return _make_result(
+				HandType.THREE_OF_A_KIND,
+				HandEvaluator._calculate_three_of_kind_rank(
+					trip_rank, kickers
+				),
+				f'Three of a Kind, {_rank_to_name(trip_rank)}s'
+			)
+
+		if num_pairs >= 2:
+			high_pair, low_pair = _unpack_nibbles(t5[exact_pair_bits], 2)
+			used = (1 << (high_pair - 2)) | (1 << (low_pair - 2))
+			kicker = t5[rank_bits & ~used] >> 16
+			return _make_result(
+				HandType.TWO_PAIR,
+				HandEvaluator._calculate_two_pair_rank(
+					high_pair, low_pair, kicker
+				),
+				f'Two Pair, {_rank_to_name(high_pair)}s and '
+				f'{_rank_to_name(low_pair)}s'
+			)
 
-		if best_result is None:
-			raise RuntimeError('No valid hand found')
+		if num_pairs == 1:
+			pair_rank = t5[exact_pair_bits] >> 16
+			kickers = _unpack_nibbles(
+				t5[rank_bits & ~(1 << (pair_rank - 2))], 3
+			)
+			return _make_result(
+				HandType.ONE_PAIR,
+				HandEvaluator._calculate_one_pair_rank(pair_rank, kickers),
+				f'Pair of {_rank_to_name(pair_rank)}s'
+			)
 
-		return best_result
+		values = _unpack_nibbles(t5[rank_bits], 5)
+		return _make_result(
+			HandType.HIGH_CARD,
+			HandEvaluator._calculate_high_card_rank(values),
+			f'High Card, {_rank_to_name(values[0])}'
+		)
+
+	@staticmethod
+	def evaluate_batch(
+		hole_idx: np.ndarray,
+		boards_idx: np.ndarray
+	) -> np.ndarray:
+		"""
+		Evaluate many 7-card hands in a single vectorized pass.
+
+		Cards are encoded as integers: (rank_value - 2) * 4 + suit_index.
+		Scores are comparable within a batch (higher = better) but are
+		not on the 1-7462 absolute rank scale used by evaluate().
+
+		Args:
+			hole_idx: Hole card indices, shape (2,) or (N, 2)
+			boards_idx: Board card indices, shape (N, 5)
+
+		Returns:
+			Array of N comparable hand scores
+		"""
+		boards = np.asarray(boards_idx, dtype=np.int64)
+		holes = np.asarray(hole_idx, dtype=np.int64)
+		if holes.ndim == 1:
+			holes = np.broadcast_to(holes, (boards.shape[0], holes.shape[0]))
+
+		cards = np.concatenate([holes, boards], axis=1)
+		ranks = cards >> 2  # 0-12 (rank value - 2)
+		suits = cards & 3
+		n = cards.shape[0]
+
+		rank_counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1)
+		suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+		rank_bits = np.bitwise_or.reduce(1 << ranks, axis=1)
+
+		# Flush detection (at most one suit can have 5+ of 7 cards)
+		flush_suit = np.argmax(suit_counts, axis=1)
+		has_flush = suit_counts[np.arange(n), flush_suit] >= 5
+		in_flush_suit = suits == flush_suit[:, None]
+		flush_bits = np.bitwise_or.reduce(
+			np.where(in_flush_suit, 1 << ranks, 0), axis=1
+		)
+
+		straight_high = _STRAIGHT_TABLE[rank_bits]
+		sf_high = np.where(has_flush, _STRAIGHT_TABLE[flush_bits], 0)
+
+		# Rank multiplicities
+		vals = np.arange(2, 15)
+		bit_vals = 1 << np.arange(13)
+		quad_rank = np.where(rank_counts == 4, vals, 0).max(axis=1)
+		trip_rank = np.where(rank_counts >= 3, vals, 0).max(axis=1)
+		paired_bits = ((rank_counts >= 2) * bit_vals).sum(axis=1)
+		exact_pair_bits = ((rank_counts == 2) * bit_vals).sum(axis=1)
+		num_pairs = (rank_counts == 2).sum(axis=1)
+
+		t5 = _TOP5_TABLE
+
+		quad_bit = np.where(quad_rank > 0, 1 << (quad_rank - 2), 0)
+		quad_tb = (quad_rank << 4) | (t5[rank_bits & ~quad_bit] >> 16)
+
+		trip_bit = np.where(trip_rank > 0, 1 << (trip_rank - 2), 0)
+		fh_pair = t5[paired_bits & ~trip_bit] >> 16
+		fh_tb = (trip_rank << 4) | fh_pair
+
+		trip_tb = (trip_rank << 8) | (t5[rank_bits & ~trip_bit] >> 12)
+
+		two_pair_top = t5[exact_pair_bits] >> 12  # two highest pairs
+		high_pair = two_pair_top >> 4
+		low_pair = two_pair_top & 0xF
+		tp_used = (
+			np.where(high_pair > 0, 1 << (high_pair - 2), 0)
+			| np.where(low_pair > 0, 1 << (low_pair - 2), 0)
+		)
+		tp_tb = (two_pair_top << 4) | (t5[rank_bits & ~tp_used] >> 16)
+
+		pair_rank = t5[exact_pair_bits] >> 16
+		pair_bit = np.where(pair_rank > 0, 1 << (pair_rank - 2), 0)
+		pair_tb = (pair_rank << 12) | (t5[rank_bits & ~pair_bit] >> 8)
+
+		conditions = [
+			sf_high > 0,
+			quad_rank > 0,
+			(trip_rank > 0) & ((paired_bits & ~trip_bit) > 0),
+			has_flush,
+			straight_high > 0,
+			trip_rank > 0,
+			num_pairs >= 2,
+			num_pairs == 1,
+		]
+		categories = np.select(conditions, [8, 7, 6, 5, 4, 3, 2, 1], default=0)
+		tiebreaks = np.select(
+			conditions,
+			[
+				sf_high, quad_tb, fh_tb, t5[flush_bits],
+				straight_high, trip_tb, tp_tb, pair_tb,
+			],
+			default=t5[rank_bits]
+		)
+
+		return (categories << 20) | tiebreaks
+
+	@staticmethod
+	def evaluate_score(cards: Iterable[Card]) -> int:
+		"""
+		Comparable hand score for 5-7 cards (higher = better).
+
+		Works directly on the precomputed Cactus Kev card codes and the
+		module rank tables, so scoring a showdown hand is a handful of
+		integer ops instead of ranking all 21 five-card combinations.
+		Accepts any iterable (the cards are walked exactly once), so
+		callers can chain hole and board cards without concatenating a
+		temporary list. Scores are on the evaluate_batch scale, not the
+		1-7462 scale.
+
+		When numba is installed the classification runs in a compiled
+		kernel over the raw card codes; the Python loops below are the
+		fallback.
+		"""
+		if _HAS_NUMBA:
+			codes = np.fromiter(
+				(card.code for card in cards), dtype=np.int64
+			)
+			return int(_kernels.score_codes(
+				codes, _TOP5_TABLE, _STRAIGHT_TABLE
+			))
+
+		rank_bits = 0
+		counts = [0] * 13
+		suit_bits = {0x8000: 0, 0x4000: 0, 0x2000: 0, 0x1000: 0}
+
+		for card in cards:
+			code = card.code
+			rank_index = (code >> 8) & 0xF
+			bit = 1 << rank_index
+			rank_bits |= bit
+			counts[rank_index] += 1
+			suit_bits[code & 0xF000] |= bit
+
+		flush_bits = 0
+		for bits in suit_bits.values():
+			if bits.bit_count() >= 5:
+				flush_bits = bits
+				break
+
+		if flush_bits:
+			sf_high = _STRAIGHT_LIST[flush_bits]
+			if sf_high:
+				return (8 << 20) | sf_high
+
+		quad_rank = 0
+		trip_rank = 0
+		paired_bits = 0
+		exact_pair_bits = 0
+		num_pairs = 0
+		for rank_index in range(13):
+			count = counts[rank_index]
+			if count < 2:
+				continue
+			paired_bits |= 1 << rank_index
+			if count == 4:
+				quad_rank = rank_index + 2
+			elif count == 3:
+				trip_rank = rank_index + 2
+			else:
+				exact_pair_bits |= 1 << rank_index
+				num_pairs += 1
+
+		t5 = _TOP5_LIST
+
+		if quad_rank:
+			quad_bit = 1 << (quad_rank - 2)
+			return (7 << 20) | (quad_rank << 4) | (
+				t5[rank_bits & ~quad_bit] >> 16
+			)
+
+		if trip_rank:
+			trip_bit = 1 << (trip_rank - 2)
+			fh_pair_bits = paired_bits & ~trip_bit
+			if fh_pair_bits:
+				return (6 << 20) | (trip_rank << 4) | (
+					t5[fh_pair_bits] >> 16
+				)
+
+		if flush_bits:
+			return (5 << 20) | t5[flush_bits]
+
+		straight_high = _STRAIGHT_LIST[rank_bits]
+		if straight_high:
+			return (4 << 20) | straight_high
+
+		if trip_rank:
+			trip_bit = 1 << (trip_rank - 2)
+			return (3 << 20) | (trip_rank << 8) | (
+				t5[rank_bits & ~trip_bit] >> 12
+			)
+
+		if num_pairs >= 2:
+			two_pair_top = t5[exact_pair_bits] >> 12
+			high_pair = two_pair_top >> 4
+			low_pair = two_pair_top & 0xF
+			used = (1 << (high_pair - 2)) | (1 << (low_pair - 2))
+			return (2 << 20) | (two_pair_top << 4) | (
+				t5[rank_bits & ~used] >> 16
+			)
+
+		if num_pairs == 1:
+			pair_rank = t5[exact_pair_bits] >> 16
+			pair_bit = 1 << (pair_rank - 2)
+			return (1 << 20) | (pair_rank << 12) | (
+				t5[rank_bits & ~pair_bit] >> 8
+			)
+
+		return t5[rank_bits]
 
 	@staticmethod
 	def _evaluate_five_cards(cards: list[Card]) -> HandResult:
 		"""Evaluates a specific 5-card hand."""
-		values = sorted([c.rank.value for c in cards])
-		suits = [c.suit for c in cards]
-		value_counts = {}
-		for v in values:
-			value_counts[v] = value_counts.get(v, 0) + 1
-
-		is_flush = len(set(suits)) == 1
-		is_straight = HandEvaluator._check_straight(values)
-		is_wheel = values == [2, 3, 4, 5, 14]  # A-2-3-4-5
+		# One pass over the cards collects the values, the flush check,
+		# the rank bitmask, and the rank-indexed tally (integer list
+		# indexing skips per-insert hashing and lets lookups scan
+		# high-first); only the value sort touches the cards again
+		first_suit = cards[0].suit
+		is_flush = True
+		counts = [0] * 15
+		rank_mask = 0
+		values = []
+		for card in cards:
+			if card.suit is not first_suit:
+				is_flush = False
+			v = card.rank.value
+			values.append(v)
+			rank_mask |= 1 << v
+			counts[v] += 1
+		values.sort()
+
+		is_wheel = rank_mask == _WHEEL_MASK  # A-2-3-4-5
+		is_straight = rank_mask in _STRAIGHT_MASKS
 
 		# Straight flush (includes royal flush)
 		if is_flush and is_straight:
@@ -122,7 +551,7 @@ class HandEvaluator:
 			)
 
 		# Four of a kind
-		four_of_kind = _find_count(value_counts, 4)
+		four_of_kind = _find_count(counts, 4)
 		if four_of_kind is not None:
 			kicker = next(v for v in values if v != four_of_kind)
 			rank_within_type = HandEvaluator._calculate_four_of_kind_rank(
@@ -139,8 +568,8 @@ class HandEvaluator:
 			)
 
 		# Full house
-		three_of_kind = _find_count(value_counts, 3)
-		pair = _find_count(value_counts, 2)
+		three_of_kind = _find_count(counts, 3)
+		pair = _find_count(counts, 2)
 		if three_of_kind is not None and pair is not None:
 			rank_within_type = HandEvaluator._calculate_full_house_rank(
 				three_of_kind, pair
@@ -203,10 +632,8 @@ class HandEvaluator:
 			)
 
 		# Two pair
-		pairs = sorted(
-			[v for v, count in value_counts.items() if count == 2],
-			reverse=True
-		)
+		# High-first scan of the tally gives the pairs already sorted
+		pairs = [v for v in range(14, 1, -1) if counts[v] == 2]
 		if len(pairs) == 2:
 			kicker = next(v for v in values if v not in pairs)
 			rank_within_type = HandEvaluator._calculate_two_pair_rank(
@@ -253,21 +680,14 @@ class HandEvaluator:
 	@staticmethod
 	def _check_straight(values: list[int]) -> bool:
 		"""
-		Checks if 5 cards form a straight.
-		Handles special case of A-2-3-4-5 (wheel).
+		Checks if 5 cards form a straight (including the A-2-3-4-5
+		wheel) by testing the rank bitmask against the ten straight
+		masks, with no sorting or set construction.
 		"""
-		sorted_values = sorted(values)
-
-		# Normal straight: consecutive values
-		if (sorted_values[-1] - sorted_values[0] == 4 and
-				len(set(sorted_values)) == 5):
-			return True
-
-		# Wheel (A-2-3-4-5): Ace acts as 1
-		if sorted_values == [2, 3, 4, 5, 14]:
-			return True
-
-		return False
+		rank_mask = 0
+		for v in values:
+			rank_mask |= 1 << v
+		return rank_mask in _STRAIGHT_MASKS
 
 	@staticmethod
 	def _encode_card_values(values: list[int]) -> int:
@@ -311,13 +731,8 @@ class HandEvaluator:
 		sorted_vals = sorted(values, reverse=True)
 		encoded = HandEvaluator._encode_card_values(sorted_vals)
 
-		# Min: [7,5,4,3,2] = lowest high card
-		# Max: [14,13,12,11,9] = highest high card (no straight)
-		min_encoded = HandEvaluator._encode_card_values([7, 5, 4, 3, 2])
-		max_encoded = HandEvaluator._encode_card_values([14, 13, 12, 11, 9])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 1277
+			encoded, _MIN_HIGH_CARD, _MAX_HIGH_CARD, 1, 1277
 		)
 
 	@staticmethod
@@ -326,13 +741,8 @@ class HandEvaluator:
 		values = [pair_value] + sorted(kickers[:3], reverse=True)
 		encoded = HandEvaluator._encode_card_values(values)
 
-		# Min: Pair of 2s with 5-4-3 kickers
-		# Max: Pair of Aces with K-Q-J kickers
-		min_encoded = HandEvaluator._encode_card_values([2, 5, 4, 3])
-		max_encoded = HandEvaluator._encode_card_values([14, 13, 12, 11])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 2860
+			encoded, _MIN_ONE_PAIR, _MAX_ONE_PAIR, 1, 2860
 		)
 
 	@staticmethod
@@ -344,13 +754,8 @@ class HandEvaluator:
 		values = [high_pair, low_pair, kicker]
 		encoded = HandEvaluator._encode_card_values(values)
 
-		# Min: 3-2 with 4 kicker
-		# Max: A-K with Q kicker
-		min_encoded = HandEvaluator._encode_card_values([3, 2, 4])
-		max_encoded = HandEvaluator._encode_card_values([14, 13, 12])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 858
+			encoded, _MIN_TWO_PAIR, _MAX_TWO_PAIR, 1, 858
 		)
 
 	@staticmethod
@@ -361,13 +766,8 @@ class HandEvaluator:
 		values = [trips_value] + sorted(kickers[:2], reverse=True)
 		encoded = HandEvaluator._encode_card_values(values)
 
-		# Min: Trip 2s with 5-4 kickers
-		# Max: Trip Aces with K-Q kickers
-		min_encoded = HandEvaluator._encode_card_values([2, 5, 4])
-		max_encoded = HandEvaluator._encode_card_values([14, 13, 12])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 858
+			encoded, _MIN_TRIPS, _MAX_TRIPS, 1, 858
 		)
 
 	@staticmethod
@@ -382,12 +782,9 @@ class HandEvaluator:
 		sorted_vals = sorted(values, reverse=True)
 		encoded = HandEvaluator._encode_card_values(sorted_vals)
 
-		# Same as high card
-		min_encoded = HandEvaluator._encode_card_values([7, 5, 4, 3, 2])
-		max_encoded = HandEvaluator._encode_card_values([14, 13, 12, 11, 9])
-
+		# Same bounds as high card
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 1277
+			encoded, _MIN_HIGH_CARD, _MAX_HIGH_CARD, 1, 1277
 		)
 
 	@staticmethod
@@ -395,13 +792,8 @@ class HandEvaluator:
 		values = [trips, pair]
 		encoded = HandEvaluator._encode_card_values(values)
 
-		# Min: 2-2-2-3-3 (trip 2s over 3s)
-		# Max: A-A-A-K-K (trip Aces over Kings)
-		min_encoded = HandEvaluator._encode_card_values([2, 3])
-		max_encoded = HandEvaluator._encode_card_values([14, 13])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 156
+			encoded, _MIN_TWO_RANKS, _MAX_TWO_RANKS, 1, 156
 		)
 
 	@staticmethod
@@ -409,13 +801,8 @@ class HandEvaluator:
 		values = [quads, kicker]
 		encoded = HandEvaluator._encode_card_values(values)
 
-		# Min: 2-2-2-2-3 (quad 2s with 3 kicker)
-		# Max: A-A-A-A-K (quad Aces with K kicker)
-		min_encoded = HandEvaluator._encode_card_values([2, 3])
-		max_encoded = HandEvaluator._encode_card_values([14, 13])
-
 		return HandEvaluator._normalize_to_range(
-			encoded, min_encoded, max_encoded, 1, 156
+			encoded, _MIN_TWO_RANKS, _MAX_TWO_RANKS, 1, 156
 		)
 
 	@staticmethod
@@ -426,10 +813,67 @@ class HandEvaluator:
 		return 1 if high_card == 5 else (high_card - 4)
 
 
-def _find_count(value_counts: dict[int, int], count: int) -> Optional[int]:
-	"""Find a value with the specified count."""
-	for v, c in value_counts.items():
-		if c == count:
+@lru_cache(maxsize=1 << 20)
+def _evaluate_cached(codes: tuple[int, ...]) -> HandResult:
+	"""
+	LRU-cached evaluation keyed by the sorted Cactus Kev codes.
+
+	Cards round-trip through the interned code table, so cache misses
+	allocate nothing beyond the classification itself.
+	"""
+	return HandEvaluator._classify_best_hand(
+		[_CARD_BY_CODE[code] for code in codes]
+	)
+
+
+# Normalization bounds for the _calculate_*_rank functions, encoded
+# once at import instead of re-encoding the same constant value lists
+# on every evaluation:
+#   high card / flush:  [7,5,4,3,2] .. [14,13,12,11,9] (no straight)
+#   one pair:           pair + 3 kickers, [2,5,4,3] .. [14,13,12,11]
+#   two pair:           pairs + kicker, [3,2,4] .. [14,13,12]
+#   trips:              trips + 2 kickers, [2,5,4] .. [14,13,12]
+#   full house / quads: two ranks, [2,3] .. [14,13]
+_MIN_HIGH_CARD = HandEvaluator._encode_card_values([7, 5, 4, 3, 2])
+_MAX_HIGH_CARD = HandEvaluator._encode_card_values([14, 13, 12, 11, 9])
+_MIN_ONE_PAIR = HandEvaluator._encode_card_values([2, 5, 4, 3])
+_MAX_ONE_PAIR = HandEvaluator._encode_card_values([14, 13, 12, 11])
+_MIN_TWO_PAIR = HandEvaluator._encode_card_values([3, 2, 4])
+_MAX_TWO_PAIR = HandEvaluator._encode_card_values([14, 13, 12])
+_MIN_TRIPS = HandEvaluator._encode_card_values([2, 5, 4])
+_MAX_TRIPS = HandEvaluator._encode_card_values([14, 13, 12])
+_MIN_TWO_RANKS = HandEvaluator._encode_card_values([2, 3])
+_MAX_TWO_RANKS = HandEvaluator._encode_card_values([14, 13])
+
+
+def _make_result(
+	hand_type: HandType,
+	rank_within_type: int,
+	description: str
+) -> HandResult:
+	"""Builds a HandResult from a category-relative rank."""
+	return HandResult(
+		absolute_rank=(
+			HandRankingConstants.HAND_TYPE_BASE_RANKS[hand_type]
+			+ rank_within_type
+		),
+		hand_type=hand_type,
+		description=description
+	)
+
+
+def _unpack_nibbles(packed: int, n: int) -> list[int]:
+	"""
+	Decode the n highest rank values from a packed TOP5 table entry
+	(highest rank in the most significant nibble), in descending order.
+	"""
+	return [(packed >> (4 * (4 - i))) & 0xF for i in range(n)]
+
+
+def _find_count(counts: list[int], count: int) -> Optional[int]:
+	"""Find the highest rank value with the specified count."""
+	for v in range(14, 1, -1):
+		if counts[v] == count:
 			return v
 	return None
 
@@ -8,6 +8,7 @@ Based on the 7,462 unique 5-card poker hands:
 Ported from Kotlin HandRankings.kt
 """
 
+from bisect import bisect_left
 from enum import Enum
 
 
@@ -66,11 +67,17 @@ class HandType(Enum):
 		if not (1 <= rank <= 7462):
 			raise ValueError(f'Invalid hand rank: {rank} (must be 1-7462)')
 
-		for hand_type in cls:
-			if rank in hand_type:
-				return hand_type
+		# The ranges are contiguous and sorted, so the first upper
+		# bound >= rank identifies the type without scanning members
+		return _TYPES_IN_ORDER[bisect_left(_UPPER_BOUNDS, rank)]
 
-		raise ValueError(f'No hand type found for rank: {rank}')
+
+# Sorted range upper bounds and matching types for from_rank's binary
+# search, built once at import (member order matches rank order)
+_TYPES_IN_ORDER: tuple[HandType, ...] = tuple(HandType)
+_UPPER_BOUNDS: tuple[int, ...] = tuple(
+	hand_type.max_rank for hand_type in _TYPES_IN_ORDER
+)
 
 
 class HandRankingConstants:
@@ -134,8 +134,8 @@ class Trainer:
 
 		# Extract strategies from information sets
 		strategies = {}
-		for key, infoset in self.solver.infoset_manager.items():
-			strategies[key] = infoset.get_average_strategy().tolist()
+		for key, strategy in self.solver.infoset_manager.items():
+			strategies[key] = strategy.tolist()
 
 		with open(path, 'wb') as f:
 			pickle.dump(strategies, f)
@@ -4,6 +4,8 @@ Neural network for Deep CFR value approximation.
 Uses PyTorch with ROCm support for AMD GPUs.
 """
 
+import random
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -175,9 +177,11 @@ class PokerValueNetwork(nn.Module):
 		Returns:
 			Action values tensor
 		"""
-		self.eval()
+		# eval() walks every submodule; only pay that on a mode change
+		if self.training:
+			self.eval()
 
-		with torch.no_grad():
+		with torch.inference_mode():
 			bucket_t = torch.tensor([bucket], device=device)
 			street_t = torch.tensor([street], device=device)
 			pot_t = torch.tensor([pot_features], dtype=torch.float32, device=device)
@@ -222,7 +226,6 @@ class ReservoirBuffer:
 			self.buffer.append(sample)
 		else:
 			# Reservoir sampling
-			import random
 			idx = random.randint(0, self.count - 1)
 			if idx < self.max_size:
 				self.buffer[idx] = sample
@@ -237,7 +240,6 @@ class ReservoirBuffer:
 		Returns:
 			List of samples
 		"""
-		import random
 		return random.sample(
 			self.buffer,
 			min(batch_size, len(self.buffer))
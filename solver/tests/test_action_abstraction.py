@@ -139,13 +139,13 @@ class TestCustomAbstraction(unittest.TestCase):
 		"""Should use custom preflop raise sizes."""
 		abstraction = ActionAbstraction(preflop_raise_sizes=[2.0, 4.0])
 
-		self.assertEqual(abstraction.preflop_raise_sizes, [2.0, 4.0])
+		self.assertEqual(abstraction.preflop_raise_sizes, (2.0, 4.0))
 
 	def test_custom_postflop_sizes(self):
 		"""Should use custom postflop bet sizes."""
 		abstraction = ActionAbstraction(postflop_bet_sizes=[0.5, 1.0, 2.0])
 
-		self.assertEqual(abstraction.postflop_bet_sizes, [0.5, 1.0, 2.0])
+		self.assertEqual(abstraction.postflop_bet_sizes, (0.5, 1.0, 2.0))
 
 
 if __name__ == '__main__':
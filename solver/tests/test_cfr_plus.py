@@ -92,9 +92,8 @@ class TestInfosetKeyGeneration(unittest.TestCase):
 		# Keys should be deterministic for same state
 		keys = list(solver.infoset_manager.keys())
 		for key in keys[:3]:
-			# Key format: bucket:street:history
-			parts = key.split(':')
-			self.assertEqual(len(parts), 3)
+			# Key format: (bucket, street, history)
+			self.assertEqual(len(key), 3)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+"""
+Tests for the Deep CFR traversal scheduler and batched inference.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import torch
+
+# Add solver root to path so 'src' is a package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.abstraction.hand_bucketing import HandBucketing
+from src.cfr.deep_cfr import DeepCFR
+from src.game.game_state import GameState
+
+
+def _make_solver() -> DeepCFR:
+	"""Small CPU solver shared by the tests below."""
+	return DeepCFR(
+		hand_bucketing=HandBucketing(
+			preflop_buckets=10,
+			postflop_buckets=5,
+			equity_samples=30
+		),
+		starting_stack=8,
+		device='cpu',
+		compile_networks=False
+	)
+
+
+class TestBatchedValues(unittest.TestCase):
+	"""Tests for batched decision-node inference."""
+
+	@classmethod
+	def setUpClass(cls):
+		torch.manual_seed(0)
+		cls.solver = _make_solver()
+
+	def _new_state(self) -> GameState:
+		solver = self.solver
+		return GameState.new_hand(
+			hole_cards=solver._deal_random_hands(),
+			stacks=[solver.starting_stack, solver.starting_stack],
+			big_blind=solver.big_blind
+		)
+
+	def _direct_values(self, state: GameState, player: int) -> np.ndarray:
+		"""Single-request forward through the player's own network."""
+		solver = self.solver
+		features = solver._extract_features(state, player)
+		batch = solver._batch_feature_tensors([features])
+		network = solver.value_networks[player]
+		network.eval()
+		with torch.inference_mode():
+			values = network(*batch)
+		return values.float().numpy()[0]
+
+	def test_rows_match_each_players_network(self):
+		"""Each request's row must come from the traversing player's
+		network, in request order, even with players interleaved."""
+		requests = [
+			(self._new_state(), 0),
+			(self._new_state(), 1),
+			(self._new_state(), 0),
+			(self._new_state(), 1),
+		]
+
+		rows = self.solver._batched_values(requests)
+
+		self.assertEqual(len(rows), len(requests))
+		for row, (state, player) in zip(rows, requests):
+			np.testing.assert_allclose(
+				row, self._direct_values(state, player),
+				rtol=1e-5, atol=1e-5
+			)
+
+	def test_rows_survive_later_sub_batches(self):
+		"""Rows returned for one player must stay intact after the other
+		player's sub-batch runs (regression: shared staging buffer)."""
+		requests = [
+			(self._new_state(), 0),
+			(self._new_state(), 1),
+		]
+
+		rows = self.solver._batched_values(requests)
+		snapshot = [row.copy() for row in rows]
+
+		# A second call must not disturb previously returned rows
+		self.solver._batched_values(requests)
+		for row, saved in zip(rows, snapshot):
+			np.testing.assert_array_equal(row, saved)
+
+
+class TestRunTraversals(unittest.TestCase):
+	"""Tests for the concurrent traversal scheduler."""
+
+	def test_traversals_fill_sample_buffers(self):
+		"""A traversal group should produce advantage and strategy
+		samples for both players."""
+		torch.manual_seed(0)
+		solver = _make_solver()
+
+		states = []
+		players = []
+		for t in range(10):
+			players.append(t % 2)
+			states.append(GameState.new_hand(
+				hole_cards=solver._deal_random_hands(),
+				stacks=[solver.starting_stack, solver.starting_stack],
+				big_blind=solver.big_blind
+			))
+
+		solver._run_traversals(states, players)
+
+		self.assertGreater(len(solver.advantage_buffers[0]), 0)
+		self.assertGreater(len(solver.advantage_buffers[1]), 0)
+		self.assertGreater(len(solver.strategy_buffer), 0)
+
+	def test_traversal_samples_have_network_width(self):
+		"""Stored advantage targets must match the action-space width."""
+		torch.manual_seed(0)
+		solver = _make_solver()
+
+		state = GameState.new_hand(
+			hole_cards=solver._deal_random_hands(),
+			stacks=[solver.starting_stack, solver.starting_stack],
+			big_blind=solver.big_blind
+		)
+		solver._run_traversals([state], [0])
+
+		_, target = solver.advantage_buffers[0].buffer[0]
+		self.assertEqual(len(target), solver.num_actions)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -209,6 +209,33 @@ class TestEncodeHistory(unittest.TestCase):
 		self.assertIn('c', history)
 
 
+class TestRolloutEquity(unittest.TestCase):
+	"""Tests for vectorized rollout equity estimation."""
+
+	def test_dominant_hand_has_high_equity(self):
+		"""Aces should be a big favourite over 7-2 offsuit."""
+		hole_cards = (
+			cards_from_string('As Ah'),
+			cards_from_string('7c 2d')
+		)
+		state = GameState.new_hand(hole_cards)
+
+		equity = state.rollout_equity(n_samples=500)
+
+		self.assertGreater(equity, 0.7)
+
+	def test_complete_board_is_deterministic(self):
+		"""With five board cards equity should be exactly 0, 0.5, or 1."""
+		hole_cards = (
+			cards_from_string('As Ah'),
+			cards_from_string('7c 2d')
+		)
+		state = GameState.new_hand(hole_cards)
+		state.community_cards = cards_from_string('Ac Kd 9h 5s 3c')
+
+		self.assertEqual(state.rollout_equity(n_samples=10), 1.0)
+
+
 if __name__ == '__main__':
 	unittest.main()
 
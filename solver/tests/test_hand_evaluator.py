@@ -8,12 +8,14 @@ import unittest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add solver root to path so 'src' is a package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.game.card import Card, cards_from_string
 from src.game.hand_rankings import HandType
-from src.game.hand_evaluator import HandEvaluator
+from src.game.hand_evaluator import HandEvaluator, card_index
 
 
 def cards(s: str) -> list[Card]:
@@ -259,6 +261,51 @@ class TestHandTypeOrdering(unittest.TestCase):
 			)
 
 
+class TestBatchEvaluation(unittest.TestCase):
+	"""Tests for the vectorized batch evaluator."""
+
+	@staticmethod
+	def _indices(cs: list[Card]):
+		return np.array([card_index(c) for c in cs])
+
+	def test_batch_matches_scalar_ordering(self):
+		"""Batch scores should order hands like evaluate()."""
+		matchups = [
+			('Ah Ad', 'Kh Kd', 'Qc Js 9h 8d 2c'),
+			('9h 8h', '7c 2d', '7h 6h 5h Kd 2c'),
+			('Ah Kd', 'Qc Qd', 'Qh Js 9h 8d 7c'),
+			('2c 3c', 'As Ks', 'Ac Kc 4c 9d 8h'),
+		]
+
+		for hole1, hole2, board in matchups:
+			h1, h2 = cards(hole1), cards(hole2)
+			b = cards(board)
+			r1 = HandEvaluator.evaluate(h1, b).absolute_rank
+			r2 = HandEvaluator.evaluate(h2, b).absolute_rank
+
+			board_idx = self._indices(b)[None, :]
+			s1 = HandEvaluator.evaluate_batch(self._indices(h1), board_idx)[0]
+			s2 = HandEvaluator.evaluate_batch(self._indices(h2), board_idx)[0]
+
+			self.assertEqual(
+				np.sign(r1 - r2), np.sign(s1 - s2),
+				f'{hole1} vs {hole2} on {board}'
+			)
+
+	def test_batch_evaluates_multiple_boards(self):
+		"""Should evaluate one hand against many boards at once."""
+		hole = self._indices(cards('Ah Ad'))
+		boards = self._indices(
+			cards('Ac As Kh 9d 8c Qc Js 9h 8d 7c')
+		).reshape(2, 5)
+
+		scores = HandEvaluator.evaluate_batch(hole, boards)
+
+		self.assertEqual(scores.shape, (2,))
+		# Quads on the first board beats one pair on the second
+		self.assertGreater(scores[0], scores[1])
+
+
 class TestAbsoluteRankRange(unittest.TestCase):
 	"""Tests for absolute rank validity."""
 
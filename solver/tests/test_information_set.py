@@ -2,6 +2,8 @@
 Tests for information set module.
 """
 
+import os
+import tempfile
 import unittest
 import sys
 from pathlib import Path
@@ -89,32 +91,46 @@ class TestInformationSetManager(unittest.TestCase):
 	"""Tests for InformationSetManager class."""
 
 	def test_get_or_create(self):
-		"""Should create new infoset if not exists."""
+		"""Should allocate rows in insertion order."""
 		manager = InformationSetManager()
 
-		infoset = manager.get_or_create('key1', num_actions=3)
-		self.assertIsNotNone(infoset)
-		self.assertEqual(infoset.num_actions, 3)
+		self.assertEqual(manager.get_or_create('key1', num_actions=3), 0)
+		self.assertEqual(manager.get_or_create('key2', num_actions=2), 1)
 
 	def test_get_or_create_returns_existing(self):
-		"""Should return existing infoset."""
+		"""Should return the existing row with its state intact."""
 		manager = InformationSetManager()
 
-		infoset1 = manager.get_or_create('key1', num_actions=3)
-		infoset1.cumulative_regrets[0] = 5.0
+		row = manager.get_or_create('key1', num_actions=3)
+		manager.update_regrets(row, np.array([5.0, 0.0, 0.0]), 0.0, 1.0)
 
-		infoset2 = manager.get_or_create('key1', num_actions=3)
+		same_row = manager.get_or_create('key1', num_actions=3)
 
-		self.assertIs(infoset1, infoset2)
-		self.assertEqual(infoset2.cumulative_regrets[0], 5.0)
+		self.assertEqual(same_row, row)
+		strategy = manager.current_strategy(same_row)
+		self.assertAlmostEqual(strategy[0], 1.0)
 
-	def test_get_returns_none_if_missing(self):
-		"""get() should return None for missing key."""
+	def test_get_strategy_returns_none_if_missing(self):
+		"""get_strategy() should return None for missing key."""
 		manager = InformationSetManager()
 
-		result = manager.get('nonexistent')
+		result = manager.get_strategy('nonexistent')
 		self.assertIsNone(result)
 
+	def test_table_growth_preserves_state(self):
+		"""Row tables should grow past initial capacity."""
+		manager = InformationSetManager(initial_capacity=2)
+
+		first = manager.get_or_create('key0', 2)
+		manager.update_regrets(first, np.array([3.0, 0.0]), 0.0, 1.0)
+
+		for i in range(1, 10):
+			manager.get_or_create(f'key{i}', 2)
+
+		self.assertEqual(len(manager), 10)
+		strategy = manager.current_strategy(first)
+		self.assertAlmostEqual(strategy[0], 1.0)
+
 	def test_len(self):
 		"""len() should return number of infosets."""
 		manager = InformationSetManager()
@@ -146,22 +162,42 @@ class TestInformationSetManager(unittest.TestCase):
 	def test_get_strategy(self):
 		"""Should get strategy by key."""
 		manager = InformationSetManager()
-		infoset = manager.get_or_create('key1', 2)
-		infoset.cumulative_regrets = np.array([1.0, 0.0])
-		infoset.get_strategy()  # Update strategy sum
+		row = manager.get_or_create('key1', 2)
+		manager.update_regrets(row, np.array([1.0, 0.0]), 0.0, 1.0)
+		manager.current_strategy(row)  # Update strategy sum
 
 		strategy = manager.get_strategy('key1')
 		self.assertIsNotNone(strategy)
 
+	def test_save_and_load_round_trip(self):
+		"""Saved tables should load back with identical strategies."""
+		manager = InformationSetManager()
+		row = manager.get_or_create('key1', 2)
+		manager.update_regrets(row, np.array([3.0, 1.0]), 0.0, 1.0)
+		manager.current_strategy(row)
+
+		with tempfile.TemporaryDirectory() as tmp:
+			prefix = os.path.join(tmp, 'cfr')
+			manager.save(prefix)
+
+			loaded = InformationSetManager()
+			loaded.load(prefix)
+
+			self.assertEqual(len(loaded), 1)
+			np.testing.assert_allclose(
+				loaded.get_strategy('key1'),
+				manager.get_strategy('key1')
+			)
+
 	def test_total_regret(self):
 		"""Should compute total regret across all infosets."""
 		manager = InformationSetManager()
 
-		infoset1 = manager.get_or_create('key1', 2)
-		infoset1.cumulative_regrets = np.array([5.0, 0.0])
+		row1 = manager.get_or_create('key1', 2)
+		manager.update_regrets(row1, np.array([5.0, 0.0]), 0.0, 1.0)
 
-		infoset2 = manager.get_or_create('key2', 2)
-		infoset2.cumulative_regrets = np.array([3.0, 2.0])
+		row2 = manager.get_or_create('key2', 2)
+		manager.update_regrets(row2, np.array([3.0, 2.0]), 0.0, 1.0)
 
 		total = manager.total_regret()
 		self.assertEqual(total, 10.0)